@@ -1,5 +1,8 @@
 """Read and display Tango stuff."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __all__ = [
     "check_tango",
     # TODO see below
@@ -16,14 +19,49 @@ __all__ = [
     "TestTangoDevice",
 ]
 
-from ska_tangoctl.tango_control.check_tango_device import check_tango, show_obs_state
-from ska_tangoctl.tango_control.read_tango_config import TangoctlDeviceConfig
-from ska_tangoctl.tango_control.read_tango_device import TangoctlDevice, TangoctlDeviceBasic
-from ska_tangoctl.tango_control.read_tango_devices import TangoctlDevices, TangoctlDevicesBasic
-from ska_tangoctl.tango_control.tango_control import TangoControl
-from ska_tangoctl.tango_control.tango_json import TangoJsonReader
-from ska_tangoctl.tango_control.test_tango_device import TestTangoDevice
-from ska_tangoctl.tango_control.test_tango_script import TangoScript
+# Most of these modules load PyTango, which is slow, so they are only imported on first use
+_LAZY_IMPORTS: dict[str, str] = {
+    "check_tango": "ska_tangoctl.tango_control.check_tango_device",
+    "show_obs_state": "ska_tangoctl.tango_control.check_tango_device",
+    "TangoControl": "ska_tangoctl.tango_control.tango_control",
+    "TangoctlDeviceBasic": "ska_tangoctl.tango_control.read_tango_device",
+    "TangoctlDevice": "ska_tangoctl.tango_control.read_tango_device",
+    "TangoctlDeviceConfig": "ska_tangoctl.tango_control.read_tango_config",
+    "TangoctlDevicesBasic": "ska_tangoctl.tango_control.read_tango_devices",
+    "TangoctlDevices": "ska_tangoctl.tango_control.read_tango_devices",
+    "TangoJsonReader": "ska_tangoctl.tango_control.tango_json",
+    "TangoScript": "ska_tangoctl.tango_control.test_tango_script",
+    "TestTangoDevice": "ska_tangoctl.tango_control.test_tango_device",
+}
+
+if TYPE_CHECKING:
+    from ska_tangoctl.tango_control.check_tango_device import check_tango, show_obs_state
+    from ska_tangoctl.tango_control.read_tango_config import TangoctlDeviceConfig
+    from ska_tangoctl.tango_control.read_tango_device import TangoctlDevice, TangoctlDeviceBasic
+    from ska_tangoctl.tango_control.read_tango_devices import (
+        TangoctlDevices,
+        TangoctlDevicesBasic,
+    )
+    from ska_tangoctl.tango_control.tango_control import TangoControl
+    from ska_tangoctl.tango_control.tango_json import TangoJsonReader
+    from ska_tangoctl.tango_control.test_tango_device import TestTangoDevice
+    from ska_tangoctl.tango_control.test_tango_script import TangoScript
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the module that provides a name when it is first used.
+
+    :param name: name of function or class
+    :return: the function or class
+    :raises AttributeError: name is not provided by this package
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
 
 # TODO weird error here
 # WARNING: autodoc: failed to import module 'tango_control' from module 'ska_tangoctl';
@@ -11,6 +11,46 @@ _module_logger = logging.getLogger(__name__)
 _module_logger.setLevel(logging.WARNING)
 
 
+# Seconds for which a host address, or the failure to find one, is remembered
+DNS_TTL: float = 60.0
+DNS_NEGATIVE_TTL: float = 10.0
+
+_DNS_CACHE: dict[str, tuple[float, str | socket.gaierror]] = {}
+
+
+def get_host_ip(tango_fqdn: str, ttl: float = DNS_TTL) -> str:
+    """
+    Look up IP address of Tango host, remembering the answer for a while.
+
+    Failed lookups are remembered for a shorter time, so that asking for a missing
+    host again does not wait for the name server every time.
+
+    :param tango_fqdn: fully qualified domain name
+    :param ttl: seconds for which a cached address is used
+    :return: IPv4 address
+    :raises gaierror: when the host name could not be resolved
+    """
+    addr_info: list
+    tango_ip: str
+
+    cached = _DNS_CACHE.get(tango_fqdn)
+    now = time.monotonic()
+    if cached is not None:
+        if isinstance(cached[1], socket.gaierror):
+            if now - cached[0] < min(ttl, DNS_NEGATIVE_TTL):
+                raise cached[1]
+        elif now - cached[0] < ttl:
+            return cached[1]
+    try:
+        addr_info = socket.getaddrinfo(tango_fqdn, None, socket.AF_INET, socket.SOCK_STREAM)
+    except socket.gaierror as addr_err:
+        _DNS_CACHE[tango_fqdn] = (now, addr_err)
+        raise
+    tango_ip = str(addr_info[0][4][0])
+    _DNS_CACHE[tango_fqdn] = (now, tango_ip)
+    return tango_ip
+
+
 def check_tango(tango_fqdn: str, tango_port: int = 10000) -> int:
     """
     Check Tango host address.
@@ -19,12 +59,10 @@ def check_tango(tango_fqdn: str, tango_port: int = 10000) -> int:
     :param tango_port: port number
     :return: error condition
     """
-    tango_addr: tuple[str, list[str], list[str]]
     tango_ip: str
 
     try:
-        tango_addr = socket.gethostbyname_ex(tango_fqdn)
-        tango_ip = tango_addr[2][0]
+        tango_ip = get_host_ip(tango_fqdn)
     except socket.gaierror as e:
         print("Could not read address %s : %s" % (tango_fqdn, e))
         return 1
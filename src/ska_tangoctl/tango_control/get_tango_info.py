@@ -6,6 +6,8 @@ from typing import Any, Tuple
 
 import tango
 
+from ska_tangoctl.tango_control.check_tango_device import get_host_ip
+
 PFIX1 = 17
 PFIX2 = 33
 PFIX3 = 50
@@ -19,12 +21,10 @@ def check_tango(tango_fqdn: str, tango_port: int = 10000) -> int:
     :param tango_port: port number
     :return: error condition
     """
-    tango_addr: tuple[str, list[str], list[str]]
     tango_ip: str
 
     try:
-        tango_addr = socket.gethostbyname_ex(tango_fqdn)
-        tango_ip = tango_addr[2][0]
+        tango_ip = get_host_ip(tango_fqdn)
     except socket.gaierror as e:
         print("Could not read address %s : %s" % (tango_fqdn, e))
         return 1
@@ -1,6 +1,5 @@
 """Read and display Tango stuff."""
 
-import json
 import logging
 import os
 import sys
@@ -9,7 +8,7 @@ from typing import Any
 import numpy
 import tango
 
-from ska_tangoctl.tango_control.tango_json import TangoJsonReader, progress_bar
+from ska_tangoctl.tango_control.tango_json import TangoJsonReader, json_loads, progress_bar
 from ska_tangoctl.tla_jargon.tla_jargon import find_jargon
 
 
@@ -253,17 +252,23 @@ class TangoctlDeviceBasic:
         for attribute in self.list_items["attributes"]:
             field_value = self.dev_values[attribute]
             field_width = self.list_items["attributes"][attribute]
-            self.logger.debug(f"Print attribute {attribute} : {field_value} {field_width=}")
+            self.logger.debug(
+                "Print attribute %s : %s field_width=%s", attribute, field_value, field_width
+            )
             print(f"{field_value:{field_width}} ", end="")
         for command in self.list_items["commands"]:
             field_value = self.dev_values[command]
             field_width = self.list_items["commands"][command]
-            self.logger.debug(f"Print command {command} : {field_value} ({field_width=})")
+            self.logger.debug(
+                "Print command %s : %s (field_width=%s)", command, field_value, field_width
+            )
             print(f"{field_value:{field_width}} ", end="")
         for tproperty in self.list_items["properties"]:
             field_value = self.dev_values[tproperty]
             field_width = self.list_items["properties"][tproperty]
-            self.logger.debug(f"Print property {tproperty} : {field_value} ({field_width=})")
+            self.logger.debug(
+                "Print property %s : %s (field_width=%s)", tproperty, field_value, field_width
+            )
             print(f"{field_value:{field_width}} ", end="")
         print(f"{self.dev_class:32}", end=eol)
 
@@ -273,15 +278,15 @@ class TangoctlDeviceBasic:
         print(f'<tr><td class="tangoctl">{self.dev_name}</td>', end="")
         for attribute in self.list_items["attributes"]:
             field_value = self.dev_values[attribute]
-            self.logger.debug(f"Print attribute {attribute} : {field_value}")
+            self.logger.debug("Print attribute %s : %s", attribute, field_value)
             print(f'<td class="tangoctl">{field_value}</td>', end="")
         for command in self.list_items["commands"]:
             field_value = self.dev_values[command]
-            self.logger.debug(f"Print command {command} : {field_value})")
+            self.logger.debug("Print command %s : %s)", command, field_value)
             print(f'<td class="tangoctl">{field_value}</td>', end="")
         for tproperty in self.list_items["properties"]:
             field_value = self.dev_values[tproperty]
-            self.logger.debug(f"Print property {tproperty} : {field_value})")
+            self.logger.debug("Print property %s : %s)", tproperty, field_value)
             print(f'<td class="tangoctl">{field_value}</td>', end="")
         print(f'<td class="tangoctl">{self.dev_class}</td></tr>\n')
 
@@ -315,15 +320,15 @@ class TangoctlDeviceBasic:
         r_buf += '<tr><td class="tangoctl">{self.dev_name}</td>'
         for attribute in self.list_items["attributes"]:
             field_value = self.dev_values[attribute]
-            self.logger.debug(f"Print attribute {attribute} : {field_value}")
+            self.logger.debug("Print attribute %s : %s", attribute, field_value)
             r_buf += f'<td class="tangoctl">{field_value}</td>'
         for command in self.list_items["commands"]:
             field_value = self.dev_values[command]
-            self.logger.debug(f"Print command {command} : {field_value})")
+            self.logger.debug("Print command %s : %s)", command, field_value)
             r_buf += f'<td class="tangoctl">{field_value}</td>'
         for t_property in self.list_items["properties"]:
             field_value = self.dev_values[t_property]
-            self.logger.debug(f"Print property {t_property} : {field_value})")
+            self.logger.debug("Print property %s : %s)", t_property, field_value)
             r_buf += f'<td class="tangoctl">{field_value}</td>'
         r_buf += f'<td class="tangoctl">{self.dev_class}</td></tr>\n'
         return r_buf
@@ -614,7 +619,7 @@ class TangoctlDevice(TangoctlDeviceBasic):
                     if not data_val:
                         devdict["attributes"][attr_name]["data"]["value"] = ""
                     elif data_val[0] == "{" and data_val[-1] == "}":
-                        devdict["attributes"][attr_name]["data"]["value"] = json.loads(data_val)
+                        devdict["attributes"][attr_name]["data"]["value"] = json_loads(data_val)
                     else:
                         devdict["attributes"][attr_name]["data"]["value"] = data_val
                 else:
@@ -789,8 +794,16 @@ class TangoctlDevice(TangoctlDeviceBasic):
         if attrib not in self.attributes:
             self.logger.error("Attribute %s not found in %s", attrib, self.attributes.keys())
             return 1
-        # Check type
-        devtype: Any = self.attributes[attrib]["data"]["type"]
+        # Check type, reading only this attribute if values have not been read yet
+        devtype: Any
+        if "data" in self.attributes[attrib]:
+            devtype = self.attributes[attrib]["data"]["type"]
+        else:
+            try:
+                devtype = str(self.dev.read_attribute(attrib).type)
+            except tango.DevFailed as terr:
+                self.logger.debug("Failed on attribute %s : %s", attrib, terr.args[-1].desc)
+                devtype = "N/A"
         wval: Any
         if devtype == "DevEnum":
             wval = int(value)
@@ -1,17 +1,24 @@
 """Read and display Tango stuff."""
 
-import json
 import logging
 import os
 import re
-from collections import OrderedDict
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
 
 import tango
-import yaml
 
 from ska_tangoctl.tango_control.read_tango_device import TangoctlDevice, TangoctlDeviceBasic
-from ska_tangoctl.tango_control.tango_json import TangoJsonReader, progress_bar
+from ska_tangoctl.tango_control.tango_json import (
+    TangoJsonReader,
+    json_dumps,
+    json_print,
+    progress_bar,
+    yaml_dumps,
+)
+
+# Number of devices that are read at the same time
+READ_WORKERS: int = 16
 
 
 class TangoctlDevicesBasic:
@@ -48,6 +55,7 @@ class TangoctlDevicesBasic:
         self.devices: dict = {}
         self.quiet_mode: bool = True
         self.dev_classes: list = []
+        self.configs_read: bool = False
         self.fmt: str
         self.cfg_data: dict
         self.tango_host: str | None
@@ -115,14 +123,14 @@ class TangoctlDevicesBasic:
                     dev_class = new_dev.dev_class
                     if dev_class == "---":
                         self.logger.debug(
-                            f"Skip basic device {device} with unknown class {dev_class}"
+                            "Skip basic device %s with unknown class %s", device, dev_class
                         )
                     elif dev_class not in self.dev_classes:
                         self.dev_classes.append(dev_class)
                         self.devices[device] = new_dev
                     else:
                         self.logger.debug(
-                            f"Skip basic device {device} with known class {dev_class}"
+                            "Skip basic device %s with known class %s", device, dev_class
                         )
                 else:
                     self.devices[device] = new_dev
@@ -136,8 +144,15 @@ class TangoctlDevicesBasic:
         self.logger.debug("Shut down TangoctlDevicesBasic for host %s", tango_host)
         os.environ.pop("TANGO_HOST", None)
 
-    def read_configs(self) -> None:
-        """Read additional data."""
+    def read_configs(self, force: bool = False) -> None:
+        """
+        Read additional data, unless that has been done already.
+
+        :param force: read again even if configs have been read
+        """
+        if self.configs_read and not force:
+            return
+        self.configs_read = True
         self.logger.debug("Read %d basic device configs...", len(self.devices))
         # Run "device in self.devices:"
         for device in progress_bar(
@@ -367,7 +382,7 @@ class TangoctlDevicesBasic:
                     dev_classes.append(dev_class)
                     self.devices[device].print_list()
 
-    def get_classes(self, reverse: bool) -> OrderedDict[Any, Any]:
+    def get_classes(self, reverse: bool) -> dict[Any, Any]:
         """
         Get list of classes.
 
@@ -386,7 +401,7 @@ class TangoctlDevicesBasic:
                 if dev_class not in dev_classes:
                     dev_classes[dev_class] = []
                 dev_classes[dev_class].append(self.devices[device].dev_name)
-        return OrderedDict(sorted(dev_classes.items(), reverse=reverse))
+        return dict(sorted(dev_classes.items(), reverse=reverse))
 
     def print_json(self, disp_action: int) -> None:
         """
@@ -399,7 +414,7 @@ class TangoctlDevicesBasic:
         self.logger.debug("Print JSON")
         devsdict = self.make_json()
         print(f'\n"{self.tango_host}":')
-        print(f"{json.dumps(devsdict, indent=4)}")
+        json_print(devsdict)
 
     def print_yaml(self, disp_action: int) -> None:
         """
@@ -413,7 +428,7 @@ class TangoctlDevicesBasic:
         self.logger.debug("Print YAML")
         devsdict = self.make_json()
         ydevsdict[self.tango_host] = devsdict
-        print(yaml.dump(ydevsdict))
+        print(yaml_dumps(ydevsdict))
 
 
 class TangoctlDevices(TangoctlDevicesBasic):
@@ -458,6 +473,8 @@ class TangoctlDevices(TangoctlDevicesBasic):
         self.tgo_space: str = ""
         self.quiet_mode: bool = True
         self.dev_classes: list = []
+        self.configs_read: bool = False
+        self.values_read: bool = False
         self.delimiter: str
         self.run_commands: list
         self.run_commands_name: list
@@ -582,13 +599,13 @@ class TangoctlDevices(TangoctlDevicesBasic):
                     dev_class: str = new_dev.dev_class
                     if dev_class == "---":
                         self.logger.debug(
-                            f"Skip basic device {device} with unknown class {dev_class}"
+                            "Skip basic device %s with unknown class %s", device, dev_class
                         )
                     elif dev_class not in self.dev_classes:
                         self.dev_classes.append(dev_class)
                         self.devices[device] = new_dev
                     else:
-                        self.logger.debug(f"Skip device {device} with known class {dev_class}")
+                        self.logger.debug("Skip device %s with known class %s", device, dev_class)
                 else:
                     self.logger.debug("Add device %s", device)
                     self.devices[device] = new_dev
@@ -619,53 +636,69 @@ class TangoctlDevices(TangoctlDevicesBasic):
     #             the_attribs[attr].append(device)
     #     self.logger.debug("Read attribute names of %d devices: ", len(the_attribs), the_attribs)
 
+    def _read_values(self, prefix: str, read_value: Callable[[TangoctlDevice], Any]) -> None:
+        """
+        Read data from all devices at the same time.
+
+        Each read waits for a reply from a device server, so a pool of threads
+        keeps several requests in flight instead of one.
+
+        :param prefix: progress bar prefix
+        :param read_value: function that reads data from one device
+        """
+        devices: list[TangoctlDevice]
+        futures: list[Future]
+        future: Future
+
+        devices = [device for device in self.devices.values() if device is not None]
+        if not devices:
+            return
+        with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(devices))) as executor:
+            futures = [executor.submit(read_value, device) for device in devices]
+            # Run "for future in futures:" in progress bar
+            for future in progress_bar(
+                futures,
+                self.prog_bar,
+                prefix=prefix,
+                suffix="complete",
+                decimals=0,
+                length=100,
+            ):
+                future.result()
+
     def read_attribute_values(self) -> None:
         """Read device data."""
         self.logger.debug("Read attribute values of %d devices...", len(self.devices))
-        # Run 'for device in self.devices:'
-        for device in progress_bar(
-            self.devices,
-            self.prog_bar,
-            prefix=f"Read {len(self.devices)} attributes :",
-            suffix="complete",
-            decimals=0,
-            length=100,
-        ):
-            if self.devices[device] is not None:
-                self.devices[device].read_attribute_value()
+        self._read_values(
+            f"Read {len(self.devices)} attributes :",
+            TangoctlDevice.read_attribute_value,
+        )
 
     def read_command_values(self) -> None:
         """Read device data."""
         self.logger.debug("Read commands of %d devices...", len(self.devices))
-        # Run "for device in self.devices:" in progress bar
-        for device in progress_bar(
-            self.devices,
-            self.prog_bar,
-            prefix=f"Read {len(self.devices)} device commands :",
-            suffix="complete",
-            decimals=0,
-            length=100,
-        ):
-            if self.devices[device] is not None:
-                self.devices[device].read_command_value(self.run_commands, self.run_commands_name)
+        self._read_values(
+            f"Read {len(self.devices)} device commands :",
+            lambda device: device.read_command_value(self.run_commands, self.run_commands_name),
+        )
 
     def read_property_values(self) -> None:
         """Read device data."""
         self.logger.debug("Read properties of %d devices...", len(self.devices))
-        # Run "for device in self.devices:" in progress bar
-        for device in progress_bar(
-            self.devices,
-            self.prog_bar,
-            prefix=f"Read {len(self.devices)} property values :",
-            suffix="complete",
-            decimals=0,
-            length=100,
-        ):
-            if self.devices[device] is not None:
-                self.devices[device].read_property_value()
+        self._read_values(
+            f"Read {len(self.devices)} property values :",
+            TangoctlDevice.read_property_value,
+        )
 
-    def read_device_values(self) -> None:
-        """Read device data."""
+    def read_device_values(self, force: bool = False) -> None:
+        """
+        Read device data, unless that has been done already.
+
+        :param force: read again even if values have been read
+        """
+        if self.values_read and not force:
+            return
+        self.values_read = True
         self.logger.debug("Read attribute, command and property data from devices")
         self.read_attribute_values()
         self.read_command_values()
@@ -769,9 +802,9 @@ class TangoctlDevices(TangoctlDevicesBasic):
         if self.output_file is not None:
             self.logger.debug("Write output file %s", self.output_file)
             with open(self.output_file, "a") as outf:
-                outf.write(json.dumps(ydevsdict, indent=4))
+                outf.write(json_dumps(ydevsdict))
         else:
-            print(json.dumps(ydevsdict, indent=4))
+            json_print(ydevsdict)
 
     def print_markdown(self, disp_action: int) -> None:
         """
@@ -821,9 +854,9 @@ class TangoctlDevices(TangoctlDevicesBasic):
         if self.output_file is not None:
             self.logger.debug("Write output file %s", self.output_file)
             with open(self.output_file, "a") as outf:
-                outf.write(yaml.dump(ydevsdict))
+                outf.write(yaml_dumps(ydevsdict))
         else:
-            print(yaml.dump(ydevsdict))
+            print(yaml_dumps(ydevsdict))
 
     def print_txt_list_attributes(self) -> None:
         """Print list of devices."""
@@ -1,243 +1,339 @@
 """Read all information about Tango devices in a Kubernetes cluster."""
 
-import json
 import logging
 import os
 import socket
-from typing import Any, OrderedDict
-
-import tango
-
-from ska_tangoctl.tango_control.read_tango_device import TangoctlDevice
-from ska_tangoctl.tango_control.read_tango_devices import TangoctlDevices, TangoctlDevicesBasic
-from ska_tangoctl.tango_control.test_tango_script import TangoScript
-
-
-class TangoControl:
-    """Connect to Tango environment and retrieve information."""
-
-    def __init__(self, logger: logging.Logger, cfg_data: Any, ns_name: str | None = None):
-        """
-        Get the show on the road.
-
-        :param logger: logging handle
-        :param cfg_data: configuration in JSON format
-        :param ns_name: K8S namespace
-        """
-        self.logger: logging.Logger = logger
-        self.cfg_data: Any = cfg_data
-        self.ns_name: str | None = ns_name
-
-    def __del__(self) -> None:
-        """Destructor."""
-        self.logger.debug("Shut down TangoControl")
-
-    def usage(self, p_name: str) -> None:
-        """
-        Show how it is done.
-
-        :param p_name: executable name
-        """
-        print("\033[1mRead Tango devices:\033[0m")
-        print("\nDisplay version number")
-        print(f"\t{p_name} --version")
-        print("\nDisplay help")
-        print(f"\t{p_name} --help")
-        print(f"\t{p_name} -h")
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from ska_tangoctl.tango_control.tango_json import json_loads, json_print
+
+if TYPE_CHECKING:
+    from ska_tangoctl.tango_control.read_tango_device import TangoctlDevice
+    from ska_tangoctl.tango_control.read_tango_devices import TangoctlDevices, TangoctlDevicesBasic
+    from ska_tangoctl.tango_control.test_tango_script import TangoScript
+
+BOLD: str = "\033[1m"
+ITALIC: str = "\033[3m"
+UNFMT: str = "\033[0m"
+
+# Help text with formatting already applied, the executable name is filled in at run time
+_USAGE_READ: str = "\n".join(
+    [
+        f"{BOLD}Read Tango devices:{UNFMT}",
+        "\nDisplay version number",
+        "\t{p} --version",
+        "\nDisplay help",
+        "\t{p} --help",
+        "\t{p} -h",
+        "\t{p} --help-topic=<read|test|params|examples>",
         # Display class names
-        print("\nDisplay classes and Tango devices associated with them")
-        print(f"\t{p_name} -d|--class [--host=<HOST>]")
-        print(f"\t{p_name} -d|--class [-H <HOST>]")
-        print(f"e.g. \033[3m{p_name} \033[0m")
+        "\nDisplay classes and Tango devices associated with them",
+        "\t{p} -d|--class [--host=<HOST>]",
+        "\t{p} -d|--class [-H <HOST>]",
+        f"e.g. {ITALIC}{{p}} {UNFMT}",
         # List device names
-        print("\nList Tango device names")
-        print(f"\t{p_name} --show-dev [--host=<HOST>]")
-        print(f"\t{p_name} -l [-H <HOST>]")
-        print(f"e.g. \033[3m{p_name} -l -K integration\033[0m")
-        print("\nDisplay all Tango devices (will take a long time)")
-        print(f"\t{p_name} --full|--short -e|--everything [--host=<HOST>]")
-        print(f"\t{p_name} -l\033[0m")
-        print(f"\te.g. \033[3m{p_name} -f|-s[-H <HOST>]\033[0m")
+        "\nList Tango device names",
+        "\t{p} --show-dev [--host=<HOST>]",
+        "\t{p} -l [-H <HOST>]",
+        f"e.g. {ITALIC}{{p}} -l -K integration{UNFMT}",
+        "\nDisplay all Tango devices (will take a long time)",
+        "\t{p} --full|--short -e|--everything [--host=<HOST>]",
+        f"\t{{p}} -l{UNFMT}",
+        f"\te.g. {ITALIC}{{p}} -f|-s[-H <HOST>]{UNFMT}",
         # Display devices
-        print("\nFilter on device name")
-        print(f"\t{p_name} --full|--short -D <DEVICE>[-H <HOST>]")
-        print(f"\t{p_name} -f|-s --device=<DEVICE> [--host=<HOST>]")
-        print(f"e.g. \033[3m{p_name} -f -D ska_mid/tm_leaf_node/csp_subarray01\033[0m")
+        "\nFilter on device name",
+        "\t{p} --full|--short -D <DEVICE>[-H <HOST>]",
+        "\t{p} -f|-s --device=<DEVICE> [--host=<HOST>]",
+        f"e.g. {ITALIC}{{p}} -f -D ska_mid/tm_leaf_node/csp_subarray01{UNFMT}",
         # Display attributes
-        print("\nFilter on attribute name")
-        print(f"\t{p_name} --full|--short --attribute=<ATTRIBUTE> [--host=<HOST>]")
-        print(f"\t{p_name} -f|-s -A <ATTRIBUTE>[-H <HOST>]")
-        print(f"e.g. \033[3m{p_name} -f -K integration -A timeout\033[0m")
+        "\nFilter on attribute name",
+        "\t{p} --full|--short --attribute=<ATTRIBUTE> [--host=<HOST>]",
+        "\t{p} -f|-s -A <ATTRIBUTE>[-H <HOST>]",
+        f"e.g. {ITALIC}{{p}} -f -K integration -A timeout{UNFMT}",
         # Display commands
-        print("\nFilter on command name")
-        print(f"\t{p_name} --full|--short --command=<COMMAND> [--host=<HOST>]")
-        print(f"\t{p_name} -f|-s -C <COMMAND>[-H <HOST>]")
-        print(f"e.g. \033[3m{p_name} -l -K integration -C status\033[0m")
+        "\nFilter on command name",
+        "\t{p} --full|--short --command=<COMMAND> [--host=<HOST>]",
+        "\t{p} -f|-s -C <COMMAND>[-H <HOST>]",
+        f"e.g. {ITALIC}{{p}} -l -K integration -C status{UNFMT}",
         # Display properties
-        print("\nFilter on property name")
-        print(f"\t{p_name} --full|--list|--short --property=<PROPERTY> [--host=<HOST>]")
-        print(f"\t{p_name} -f|-s -P <PROPERTY> [--host=<HOST>]")
-        print(f"e.g. \033[3m{p_name} -l -K integration -P power\033[0m")
+        "\nFilter on property name",
+        "\t{p} --full|--list|--short --property=<PROPERTY> [--host=<HOST>]",
+        "\t{p} -f|-s -P <PROPERTY> [--host=<HOST>]",
+        f"e.g. {ITALIC}{{p}} -l -K integration -P power{UNFMT}",
         # TODO make this work
-        # print("\nDisplay known acronyms")
-        # print(f"\t{p_name} -j")
+        # "\nDisplay known acronyms",
+        # "\t{p} -j",
         # Testing with input file
-        print(f"\nDisplay {p_name} test input files")
-        print(f"\t{p_name} --json-dir=<PATH>")
-        print(f"\t{p_name} -J <PATH>")
-        print(f"e.g. \033[3mADMIN_MODE=1 {p_name} -J resources/\033[0m")
-        print("\nRun test, reading from input file")
-        print(f"\t{p_name} --input=<FILE>")
-        print(f"\t{p_name} -I <FILE>")
-        print("Files are in JSON format and contain values to be read and/or written, e.g:")
-        print(
-            """\033[3m{
+        "\nDisplay {p} test input files",
+        "\t{p} --json-dir=<PATH>",
+        "\t{p} -J <PATH>",
+        f"e.g. {ITALIC}ADMIN_MODE=1 {{p}} -J resources/{UNFMT}",
+        "\nRun test, reading from input file",
+        "\t{p} --input=<FILE>",
+        "\t{p} -I <FILE>",
+        "Files are in JSON format and contain values to be read and/or written, e.g:",
+        f"""{ITALIC}{{
     "description": "Turn admin mode on and check status",
     "test_on": [
-        {
+        {{
             "attribute": "adminMode",
             "read" : ""
-        },
-        {
+        }},
+        {{
             "attribute": "adminMode",
             "write": 1
-        },
-        {
+        }},
+        {{
             "attribute": "adminMode",
             "read": 1
-        },
-        {
+        }},
+        {{
             "command": "State",
             "return": "OFFLINE"
-        },
-        {
+        }},
+        {{
             "command": "Status"
-        }
+        }}
     ]
-}\033[0m
-"""
-        )
-        print("Files can contain environment variables that are read at run-time:")
-        print(
-            """\033[3m{
+}}{UNFMT}
+""",
+        "Files can contain environment variables that are read at run-time:",
+        f"""{ITALIC}{{
     "description": "Turn admin mode off and check status",
     "test_on": [
-        {
+        {{
             "attribute": "adminMode",
             "read": ""
-        },
-        {
+        }},
+        {{
             "attribute": "adminMode",
-            "write": "${ADMIN_MODE}"
-        },
-        {
+            "write": "${{ADMIN_MODE}}"
+        }},
+        {{
             "attribute": "adminMode",
-            "read": "${ADMIN_MODE}"
-        },
-        {
+            "read": "${{ADMIN_MODE}}"
+        }},
+        {{
             "command": "State",
             "return": "ONLINE"
-        },
-        {
+        }},
+        {{
             "command": "Status"
-        }
+        }}
     ]
-}\033[0m
-"""
-        )
-        print("To run the above:")
-        print(
-            f"\033[3mADMIN_MODE=1 {p_name}"
-            " --k8s-ns=ci-ska-mid-itf-at-1820-tmc-test-sdp-notebook-v2"
-            " -D mid_csp_cbf/talon_board/001 -f --in resources/dev_online.json -V\033[0m"
-        )
+}}{UNFMT}
+""",
+        "To run the above:",
+        f"{ITALIC}ADMIN_MODE=1 {{p}}"
+        " --k8s-ns=ci-ska-mid-itf-at-1820-tmc-test-sdp-notebook-v2"
+        f" -D mid_csp_cbf/talon_board/001 -f --in resources/dev_online.json -V{UNFMT}",
+        "",
+    ]
+)
+
+_USAGE_TEST: str = "\n".join(
+    [
         # Testing
-        print("\n\033[1mTest Tango devices:\033[0m")
-        print("\nTest a Tango device")
-        print(f"\t{p_name}[-H <HOST>] -D <DEVICE> [--simul=<0|1>]")
-        print("\nTest a Tango device and read attributes")
-        print(f"\t{p_name} -a[-H <HOST>] -D <DEVICE> [--simul=<0|1>]")
-        print("\nDisplay attribute and command names for a Tango device")
-        print(f"\t{p_name} -c[-H <HOST>] -D <DEVICE>")
-        print("\nTurn a Tango device on")
-        print(f"\t{p_name} --on[-H <HOST>] -D <DEVICE> [--simul=<0|1>]")
-        print("\nTurn a Tango device off")
-        print(f"\t{p_name} --off[-H <HOST>] -D <DEVICE> [--simul=<0|1>]")
-        print("\nSet a Tango device to standby mode")
-        print(f"\t{p_name} --standby[-H <HOST>] -D <DEVICE> [--simul=<0|1>]")
-        print("\nChange admin mode on a Tango device")
-        print(f"\t{p_name} --admin=<0|1>")
-        print("\nDisplay status of a Tango device")
-        print(f"\t{p_name} --status[-H <HOST>] -D <DEVICE>")
-        print("\nCheck events for attribute of a Tango device")
-        print(f"\t{p_name}[-H <HOST>] -D <DEVICE> -A <ATTRIBUTE>")
+        f"\n{BOLD}Test Tango devices:{UNFMT}",
+        "\nTest a Tango device",
+        "\t{p}[-H <HOST>] -D <DEVICE> [--simul=<0|1>]",
+        "\nTest a Tango device and read attributes",
+        "\t{p} -a[-H <HOST>] -D <DEVICE> [--simul=<0|1>]",
+        "\nDisplay attribute and command names for a Tango device",
+        "\t{p} -c[-H <HOST>] -D <DEVICE>",
+        "\nTurn a Tango device on",
+        "\t{p} --on[-H <HOST>] -D <DEVICE> [--simul=<0|1>]",
+        "\nTurn a Tango device off",
+        "\t{p} --off[-H <HOST>] -D <DEVICE> [--simul=<0|1>]",
+        "\nSet a Tango device to standby mode",
+        "\t{p} --standby[-H <HOST>] -D <DEVICE> [--simul=<0|1>]",
+        "\nChange admin mode on a Tango device",
+        "\t{p} --admin=<0|1>",
+        "\nDisplay status of a Tango device",
+        "\t{p} --status[-H <HOST>] -D <DEVICE>",
+        "\nCheck events for attribute of a Tango device",
+        "\t{p}[-H <HOST>] -D <DEVICE> -A <ATTRIBUTE>",
+        "",
+    ]
+)
+
+_USAGE_PARAMS: str = "\n".join(
+    [
         # Options and parameters
-        print("\n\033[1mParameters:\033[0m\n")
-        print("\t-a\t\t\t\tflag for reading attributes during tests")
-        print("\t-c|--cmd\t\t\tflag for running commands during tests")
-        print("\t--simul=<0|1>\t\t\tset simulation mode off or on")
-        print("\t--admin=<0|1>\t\t\tset admin mode off or on")
-        print("\t-e|--everything\t\t\tshow all devices")
-        print("\t-f|--full\t\t\tdisplay in full")
-        print("\t-l|--list\t\t\tdisplay device name and status on one line")
-        print("\t-s|--short\t\t\tdisplay device name, status and query devices")
-        print("\t-q|--quiet\t\t\tdo not display progress bars")
-        print("\t-w|--html\t\t\toutput in HTML format")
-        print("\t-j|--json\t\t\toutput in JSON format")
-        print("\t-m|--md\t\t\t\toutput in markdown format")
-        print("\t-y|--yaml\t\t\toutput in YAML format")
-        print("\t-u|--unique\t\t\tonly read one device for each class")
-        print("\t--cfg=<FILE>\t\toverride configuration from file")
-        print("\t-X <FILE>")
-        print("\t--json-dir=<PATH>\t\tdirectory with JSON input file, e.g. 'resources'")
-        print("\t-J <PATH>")
-        print(
-            "\t--device=<DEVICE>\t\tdevice name, e.g. 'csp'"
-            " (not case sensitive, only a part is needed)"
-        )
-        print("\t-D <DEVICE>")
-        print("\t--host=<HOST>\t\t\tTango database host and port, e.g. 10.8.13.15:10000")
-        print("\t-H <HOST>")
-        print("\t--attribute=<ATTRIBUTE>\t\tattribute name, e.g. 'obsState' (not case sensitive)")
-        print("\t-A <ATTRIBUTE>")
-        print("\t--command=<COMMAND>\t\tcommand name, e.g. 'Status' (not case sensitive)")
-        print("\t-C <COMMAND>")
-        print("\t--output=<FILE>\t\t\toutput file name")
-        print("\t-O <FILE>")
-        print("\t--input=<FILE>\t\t\tinput file name")
-        print("\t-I <FILE>")
-        print(
-            "\nNote that values for device, attribute, command or property are not case sensitive."
-        )
-        print(
-            f"Partial matches for strings longer than {self.cfg_data['min_str_len']}"
-            " charaters are OK."
-        )
-        print(
-            "\nRun the following commands where applicable:"
-            f"\n\t{','.join(self.cfg_data['run_commands'])}"
-        )
-        print(
-            f"\nRun commands with device name as parameter where applicable:\n"
-            f"\t{','.join(self.cfg_data['run_commands_name'])}"
-        )
+        f"\n{BOLD}Parameters:{UNFMT}\n",
+        "\t-a\t\t\t\tflag for reading attributes during tests",
+        "\t-c|--cmd\t\t\tflag for running commands during tests",
+        "\t--simul=<0|1>\t\t\tset simulation mode off or on",
+        "\t--admin=<0|1>\t\t\tset admin mode off or on",
+        "\t-e|--everything\t\t\tshow all devices",
+        "\t-f|--full\t\t\tdisplay in full",
+        "\t-l|--list\t\t\tdisplay device name and status on one line",
+        "\t-s|--short\t\t\tdisplay device name, status and query devices",
+        "\t-q|--quiet\t\t\tdo not display progress bars",
+        "\t-w|--html\t\t\toutput in HTML format",
+        "\t-j|--json\t\t\toutput in JSON format",
+        "\t-m|--md\t\t\t\toutput in markdown format",
+        "\t-y|--yaml\t\t\toutput in YAML format",
+        "\t-u|--unique\t\t\tonly read one device for each class",
+        "\t--cfg=<FILE>\t\toverride configuration from file",
+        "\t-X <FILE>",
+        "\t--json-dir=<PATH>\t\tdirectory with JSON input file, e.g. 'resources'",
+        "\t-J <PATH>",
+        "\t--device=<DEVICE>\t\tdevice name, e.g. 'csp'"
+        " (not case sensitive, only a part is needed)",
+        "\t-D <DEVICE>",
+        "\t--host=<HOST>\t\t\tTango database host and port, e.g. 10.8.13.15:10000",
+        "\t-H <HOST>",
+        "\t--attribute=<ATTRIBUTE>\t\tattribute name, e.g. 'obsState' (not case sensitive)",
+        "\t-A <ATTRIBUTE>",
+        "\t--command=<COMMAND>\t\tcommand name, e.g. 'Status' (not case sensitive)",
+        "\t-C <COMMAND>",
+        "\t--output=<FILE>\t\t\toutput file name",
+        "\t-O <FILE>",
+        "\t--input=<FILE>\t\t\tinput file name",
+        "\t-I <FILE>",
+        "\nNote that values for device, attribute, command or property are not case sensitive.",
+        "",
+    ]
+)
+
+_USAGE_EXAMPLES: str = "\n".join(
+    [
         # Some more examples
-        print("\n\033[1mExamples:\033[0m\n")
-        print(f"\t{p_name} -l")
-        print(f"\t{p_name} -D talon -l")
-        print(f"\t{p_name} -A timeout")
-        print(f"\t{p_name} -C Telescope")
-        print(f"\t{p_name} -P Power")
-        print(f"\t{p_name} -D mid_csp_cbf/talon_lru/001 -f")
-        print(f"\t{p_name} -D mid_csp_cbf/talon_lru/001 -q")
-        print(f"\t{p_name} -D mid_csp_cbf/talon_board/001 -f")
-        print(f"\t{p_name} -D mid_csp_cbf/talon_board/001 -f --dry")
-        print(f"\t{p_name} -D mid-sdp/control/0 --on")
-        print(
-            f"\tADMIN_MODE=1 {p_name} "
-            f" -D mid_csp_cbf/talon_board/001 -f --in resources/dev_online.json -V"
+        f"\n{BOLD}Examples:{UNFMT}\n",
+        "\t{p} -l",
+        "\t{p} -D talon -l",
+        "\t{p} -A timeout",
+        "\t{p} -C Telescope",
+        "\t{p} -P Power",
+        "\t{p} -D mid_csp_cbf/talon_lru/001 -f",
+        "\t{p} -D mid_csp_cbf/talon_lru/001 -q",
+        "\t{p} -D mid_csp_cbf/talon_board/001 -f",
+        "\t{p} -D mid_csp_cbf/talon_board/001 -f --dry",
+        "\t{p} -D mid-sdp/control/0 --on",
+        "\tADMIN_MODE=1 {p} "
+        " -D mid_csp_cbf/talon_board/001 -f --in resources/dev_online.json -V",
+        "\n",
+    ]
+)
+
+
+def _read_description(file_name: str) -> Any:
+    """
+    Read the description from a JSON script file.
+
+    :param file_name: input file name
+    :return: description, None if there is none, or the error if the file is not valid JSON
+    """
+    cfg_data: Any
+
+    with open(file_name, "rb") as cfg_file:
+        try:
+            cfg_data = json_loads(cfg_file.read())
+        except ValueError as jerr:
+            return jerr
+    return cfg_data.get("description") if isinstance(cfg_data, dict) else None
+
+
+class TangoControl:
+    """Connect to Tango environment and retrieve information."""
+
+    __slots__ = (
+        "logger",
+        "cfg_data",
+        "ns_name",
+        "_devices_cache",
+        "_filtered_devices_cache",
+        "_device_cache",
+    )
+
+    # Parts of the help text that can be shown on their own
+    USAGE_TOPICS: tuple[str, ...] = ("read", "test", "params", "examples")
+
+    # Output format and the TangoctlDevices method that displays it
+    _PRINT_METHODS: dict[str, str] = {
+        "txt": "print_txt",
+        "html": "print_html",
+        "json": "print_json",
+        "md": "print_markdown",
+        "yaml": "print_yaml",
+    }
+    # File name extension for each output format
+    _FILE_SUFFIXES: dict[str, str] = {fmt: f".{fmt}" for fmt in _PRINT_METHODS}
+
+    def __init__(self, logger: logging.Logger, cfg_data: Any, ns_name: str | None = None):
+        """
+        Get the show on the road.
+
+        :param logger: logging handle
+        :param cfg_data: configuration in JSON format
+        :param ns_name: K8S namespace
+        """
+        self.logger: logging.Logger = logger
+        self.cfg_data: Any = cfg_data
+        self.ns_name: str | None = ns_name
+        self._devices_cache: dict[tuple, TangoctlDevicesBasic] = {}
+        self._filtered_devices_cache: dict[tuple, TangoctlDevices] = {}
+        self._device_cache: dict[tuple, TangoctlDevice] = {}
+
+    def __del__(self) -> None:
+        """Destructor."""
+        self.logger.debug("Shut down TangoControl")
+
+    def clear_cache(self) -> None:
+        """Forget devices read earlier, so that the Tango database is queried again."""
+        self.logger.debug(
+            "Clear %d cached device lists",
+            len(self._devices_cache) + len(self._filtered_devices_cache),
         )
-        print()
+        self._devices_cache.clear()
+        self._filtered_devices_cache.clear()
+        self._device_cache.clear()
+
+    def usage_topic_ok(self, topic: str | None) -> bool:
+        """
+        Check that help topic is known.
+
+        :param topic: help topic, or None for everything
+        :return: true if it is known
+        """
+        if topic is None or topic in self.USAGE_TOPICS:
+            return True
+        self.logger.error(
+            "Unknown help topic '%s', use one of %s", topic, ", ".join(self.USAGE_TOPICS)
+        )
+        return False
+
+    def usage(self, p_name: str, topic: str | None = None) -> None:
+        """
+        Show how it is done.
+
+        :param p_name: executable name
+        :param topic: only show this part, one of USAGE_TOPICS
+        """
+        if not self.usage_topic_ok(topic):
+            return
+        parts: list[str] = []
+        if topic in (None, "read"):
+            parts.append(_USAGE_READ.replace("{p}", p_name))
+        if topic in (None, "test"):
+            parts.append(_USAGE_TEST.replace("{p}", p_name))
+        if topic in (None, "params"):
+            parts.append(_USAGE_PARAMS.replace("{p}", p_name))
+            parts.append(
+                f"Partial matches for strings longer than {self.cfg_data['min_str_len']}"
+                " charaters are OK.\n"
+                "\nRun the following commands where applicable:"
+                f"\n\t{','.join(self.cfg_data['run_commands'])}\n"
+                f"\nRun commands with device name as parameter where applicable:\n"
+                f"\t{','.join(self.cfg_data['run_commands_name'])}\n"
+            )
+        if topic in (None, "examples"):
+            parts.append(_USAGE_EXAMPLES.replace("{p}", p_name))
+        # One write for the whole text
+        sys.stdout.write("".join(parts))
 
     def read_input_file(self, input_file: str | None, tgo_name: str | None, dry_run: bool) -> None:
         """
@@ -252,6 +348,8 @@ class TangoControl:
 
         if input_file is None:
             return
+        from ska_tangoctl.tango_control.test_tango_script import TangoScript
+
         inf = input_file
         tgo_script = TangoScript(self.logger, inf, tgo_name, dry_run)
         tgo_script.run()
@@ -272,52 +370,66 @@ class TangoControl:
         """
         tango_fqdn: str
         tport: int
-        tango_addr: tuple[str, list[str], list[str]]
         tango_ip: str
 
-        if ":" in tango_host:
-            tango_fqdn = tango_host.split(":")[0]
-            tport = int(tango_host.split(":")[1])
+        from ska_tangoctl.tango_control.check_tango_device import get_host_ip
+
+        tango_fqdn, sep, port = tango_host.rpartition(":")
+        if sep:
+            tport = int(port)
         else:
             tango_fqdn = tango_host
             tport = tango_port
         self.logger.info("Check Tango host %s:%d", tango_fqdn, tport)
         try:
-            tango_addr = socket.gethostbyname_ex(tango_fqdn)
-            tango_ip = tango_addr[2][0]
+            tango_ip = get_host_ip(tango_fqdn)
         except socket.gaierror as e:
-            self.logger.error("Could not read address %s : %s" % (tango_fqdn, e))
+            self.logger.error("Could not read address %s : %s", tango_fqdn, e)
             return 1
         if not quiet_mode:
             print(f"TANGO_HOST={tango_fqdn}:{tport}")
             print(f"TANGO_HOST={tango_ip}:{tport}")
         return 0
 
-    def get_tango_classes(
+    def _make_devices_basic(
         self,
-        fmt: str,
-        evrythng: bool,
+        uniq_cls: bool,
         quiet_mode: bool,
-        tgo_name: str | None,
         reverse: bool,
-    ) -> dict:
+        evrythng: bool,
+        tgo_name: str | None,
+        fmt: str,
+        purpose: str,
+    ) -> "TangoctlDevicesBasic | None":
         """
-        Read tango classes.
+        Read list of Tango devices and their configuration, without reading values.
 
-        :param fmt: output format
-        :param evrythng: get commands and attributes regadrless of state
+        The result is kept for the lifetime of this object, so that asking for the
+        same devices twice does not query the Tango database again.
+
+        :param uniq_cls: only read one device per class
         :param quiet_mode: flag for displaying progress bars
-        :param tgo_name: device name
         :param reverse: sort in reverse order
-        :return: dictionary with devices
+        :param evrythng: get commands and attributes regadrless of state
+        :param tgo_name: device name
+        :param fmt: output format
+        :param purpose: what the devices are needed for, used in error messages
+        :return: devices, or None if the Tango connection failed
         """
-        devices: TangoctlDevicesBasic
-        dev_classes: OrderedDict
+        import tango
 
+        from ska_tangoctl.tango_control.read_tango_devices import TangoctlDevicesBasic
+
+        devices: TangoctlDevicesBasic
+        # The output format is only stored, it does not change which devices are read
+        cache_key = (os.getenv("TANGO_HOST"), uniq_cls, quiet_mode, reverse, evrythng, tgo_name)
+        if cache_key in self._devices_cache:
+            self.logger.debug("Use cached devices for %s", purpose)
+            return self._devices_cache[cache_key]
         try:
             devices = TangoctlDevicesBasic(
                 self.logger,
-                False,
+                uniq_cls,
                 quiet_mode,
                 reverse,
                 evrythng,
@@ -327,12 +439,115 @@ class TangoControl:
                 self.ns_name,
             )
         except tango.ConnectionFailed:
-            self.logger.error("Tango connection for classes failed")
-            return {}
-        except Exception:
-            self.logger.error("Tango connection for classes failed")
-            return {}
+            self.logger.error("Tango connection for %s failed", purpose)
+            return None
+        except Exception as eerr:
+            self.logger.error("Tango connection for %s failed : %s", purpose, eerr)
+            return None
         devices.read_configs()
+        self._devices_cache[cache_key] = devices
+        return devices
+
+    def _make_devices(
+        self,
+        uniq_cls: bool,
+        quiet_mode: bool,
+        reverse: bool,
+        evrythng: bool,
+        tgo_name: str | None,
+        tgo_attrib: str | None,
+        tgo_cmd: str | None,
+        tgo_prop: str | None,
+        file_name: str | None,
+        fmt: str,
+        purpose: str,
+    ) -> "TangoctlDevices | None":
+        """
+        Read list of Tango devices while applying filters.
+
+        As with _make_devices_basic, the result is kept for the lifetime of this object.
+
+        :param uniq_cls: only read one device per class
+        :param quiet_mode: flag for displaying progress bars
+        :param reverse: sort in reverse order
+        :param evrythng: get commands and attributes regadrless of state
+        :param tgo_name: device name
+        :param tgo_attrib: attribute name
+        :param tgo_cmd: filter command name
+        :param tgo_prop: filter property name
+        :param file_name: output file name
+        :param fmt: output format
+        :param purpose: what the devices are needed for, used in error messages
+        :return: devices, or None if the Tango connection failed
+        """
+        import tango
+
+        from ska_tangoctl.tango_control.read_tango_devices import TangoctlDevices
+
+        devices: TangoctlDevices
+        cache_key = (
+            os.getenv("TANGO_HOST"),
+            uniq_cls,
+            quiet_mode,
+            reverse,
+            evrythng,
+            tgo_name,
+            tgo_attrib,
+            tgo_cmd,
+            tgo_prop,
+            file_name,
+            fmt,
+        )
+        if cache_key in self._filtered_devices_cache:
+            self.logger.debug("Use cached devices for %s", purpose)
+            return self._filtered_devices_cache[cache_key]
+        try:
+            devices = TangoctlDevices(
+                self.logger,
+                uniq_cls,
+                quiet_mode,
+                reverse,
+                evrythng,
+                self.cfg_data,
+                tgo_name,
+                tgo_attrib,
+                tgo_cmd,
+                tgo_prop,
+                file_name,
+                fmt,
+            )
+        except tango.ConnectionFailed:
+            self.logger.error("Tango connection for %s failed", purpose)
+            return None
+        self._filtered_devices_cache[cache_key] = devices
+        return devices
+
+    def get_tango_classes(
+        self,
+        fmt: str,
+        evrythng: bool,
+        quiet_mode: bool,
+        tgo_name: str | None,
+        reverse: bool,
+    ) -> dict:
+        """
+        Read tango classes.
+
+        :param fmt: output format
+        :param evrythng: get commands and attributes regadrless of state
+        :param quiet_mode: flag for displaying progress bars
+        :param tgo_name: device name
+        :param reverse: sort in reverse order
+        :return: dictionary with devices
+        """
+        devices: TangoctlDevicesBasic | None
+        dev_classes: dict
+
+        devices = self._make_devices_basic(
+            False, quiet_mode, reverse, evrythng, tgo_name, fmt, "classes"
+        )
+        if devices is None:
+            return {}
         dev_classes = devices.get_classes(reverse)
         return dev_classes
 
@@ -354,51 +569,23 @@ class TangoControl:
         :param tgo_name: device name
         :return: error condition
         """
-        devices: TangoctlDevicesBasic
-        dev_classes: OrderedDict
+        devices: TangoctlDevicesBasic | None
+        dev_classes: dict
 
+        if fmt not in ("json", "txt"):
+            self.logger.error("Format '%s' not supported for listing classes", fmt)
+            return 1
+        self.logger.info("List device classes (%s)", fmt)
+        devices = self._make_devices_basic(
+            False, quiet_mode, reverse, evrythng, tgo_name, fmt, "class list"
+        )
+        if devices is None:
+            return 1
         if fmt == "json":
-            self.logger.info("Get device classes in JSON format")
-            try:
-                devices = TangoctlDevicesBasic(
-                    self.logger,
-                    False,
-                    quiet_mode,
-                    reverse,
-                    evrythng,
-                    self.cfg_data,
-                    tgo_name,
-                    fmt,
-                    self.ns_name,
-                )
-            except tango.ConnectionFailed:
-                self.logger.error("Tango connection for JSON class list failed")
-                return 1
-            devices.read_configs()
             dev_classes = devices.get_classes(reverse)
-            print(json.dumps(dev_classes, indent=4))
-        elif fmt == "txt":
-            self.logger.info("List device classes (%s)", fmt)
-            try:
-                devices = TangoctlDevicesBasic(
-                    self.logger,
-                    False,
-                    quiet_mode,
-                    reverse,
-                    evrythng,
-                    self.cfg_data,
-                    tgo_name,
-                    fmt,
-                    self.ns_name,
-                )
-            except tango.ConnectionFailed:
-                self.logger.error("Tango connection for text class list failed")
-                return 1
-            devices.read_configs()
-            devices.print_txt_classes()
+            json_print(dev_classes)
         else:
-            self.logger.error("Format '%s' not supported for listing classes", fmt)
-            return 1
+            devices.print_txt_classes()
         return 0
 
     def list_devices(
@@ -423,28 +610,14 @@ class TangoControl:
         :param tgo_name: device name
         :return: error condition
         """
-        devices: TangoctlDevicesBasic
+        devices: TangoctlDevicesBasic | None
 
         self.logger.info("List devices (%s) with name %s", fmt, tgo_name)
-        try:
-            devices = TangoctlDevicesBasic(
-                self.logger,
-                uniq_cls,
-                quiet_mode,
-                reverse,
-                evrythng,
-                self.cfg_data,
-                tgo_name,
-                fmt,
-                self.ns_name,
-            )
-        except tango.ConnectionFailed:
-            self.logger.error("Tango connection for listing devices failed")
-            return 1
-        except Exception as eerr:
-            self.logger.error("Tango connection for listing devices failed : %s", eerr)
+        devices = self._make_devices_basic(
+            uniq_cls, quiet_mode, reverse, evrythng, tgo_name, fmt, "listing devices"
+        )
+        if devices is None:
             return 1
-        devices.read_configs()
         if fmt == "json":
             devices.print_json(0)
         elif fmt == "yaml":
@@ -468,39 +641,74 @@ class TangoControl:
         relevant_path: str
         file_names: list
         file_name: str
-        cfg_data: Any
-        description: str
+        descriptions: list
+        description: Any
+        lines: list[str] = []
 
         rv = 0
         self.logger.info("List JSON files in %s", json_dir)
         relevant_path = json_dir
         # TODO read YAML files as well
-        # included_extensions = ["json", "yaml"]
-        included_extensions: list = ["json"]
-        file_names = [
-            fn
-            for fn in os.listdir(relevant_path)
-            if any(fn.endswith(ext) for ext in included_extensions)
-        ]
+        # included_extensions = (".json", ".yaml")
+        included_extensions: tuple = (".json",)
+        with os.scandir(relevant_path) as dir_entries:
+            file_names = [
+                entry.path
+                for entry in dir_entries
+                if entry.name.endswith(included_extensions) and entry.is_file()
+            ]
         if not file_names:
             self.logger.warning("No JSON files found in %s", json_dir)
             return 1
-        for file_name in file_names:
-            file_name = os.path.join(json_dir, file_name)
-            with open(file_name) as cfg_file:
-                try:
-                    cfg_data = json.load(cfg_file)
-                    try:
-                        description = cfg_data["description"]
-                        if not quiet_mode:
-                            print(f"{file_name:40} {description}")
-                    except KeyError:
-                        self.logger.warning("File %s is not a tangoctl input file", file_name)
-                        rv += 1
-                except json.decoder.JSONDecodeError:
-                    self.logger.warning("File %s is not a JSON file", file_name)
+        # Files are independent, so overlap the reads; map keeps the listing in order
+        with ThreadPoolExecutor(max_workers=min(32, len(file_names))) as executor:
+            descriptions = list(executor.map(_read_description, file_names))
+        for file_name, description in zip(file_names, descriptions):
+            if isinstance(description, ValueError):
+                self.logger.warning("File %s is not a JSON file", file_name)
+                continue
+            if description is None:
+                self.logger.warning("File %s is not a tangoctl input file", file_name)
+                rv += 1
+            elif not quiet_mode:
+                lines.append(f"{file_name:40} {description}\n")
+        if lines:
+            sys.stdout.write("".join(lines))
         return rv
 
+    def set_values(
+        self, tgo_name: str, quiet_mode: bool, reverse: bool, attribs: dict[str, str]
+    ) -> int:
+        """
+        Set values for a Tango device, using one connection.
+
+        The device connection is kept, so that setting more values later does not
+        connect again.
+
+        :param tgo_name: device name
+        :param quiet_mode: flag for displaying progress bar
+        :param reverse: sort in reverse order
+        :param attribs: attribute names and values
+        :return: error condition
+        """
+        dev: TangoctlDevice
+        rc: int = 0
+
+        from ska_tangoctl.tango_control.read_tango_device import TangoctlDevice
+
+        cache_key = (os.getenv("TANGO_HOST"), tgo_name)
+        if cache_key in self._device_cache:
+            dev = self._device_cache[cache_key]
+        else:
+            dev = TangoctlDevice(self.logger, quiet_mode, reverse, tgo_name, {}, None, None, None)
+            self._device_cache[cache_key] = dev
+        for tgo_attrib, tgo_value in attribs.items():
+            self.logger.info(
+                "Set device %s attribute %s value to %s", tgo_name, tgo_attrib, tgo_value
+            )
+            rc |= dev.write_attribute_value(tgo_attrib, tgo_value)
+        return rc
+
     def set_value(
         self, tgo_name: str, quiet_mode: bool, reverse: bool, tgo_attrib: str, tgo_value: str
     ) -> int:
@@ -514,13 +722,21 @@ class TangoControl:
         :param tgo_value: attribute value
         :return: error condition
         """
-        dev: TangoctlDevice
+        return self.set_values(tgo_name, quiet_mode, reverse, {tgo_attrib: tgo_value})
 
-        dev = TangoctlDevice(self.logger, quiet_mode, reverse, tgo_name, {}, None, None, None)
-        dev.read_attribute_value()
-        self.logger.info("Set device %s attribute %s value to %s", tgo_name, tgo_attrib, tgo_value)
-        dev.write_attribute_value(tgo_attrib, tgo_value)
-        return 0
+    def print_devices(self, devices: "TangoctlDevices", fmt: str, disp_action: int) -> None:
+        """
+        Display devices in the requested format.
+
+        :param devices: devices with values already read
+        :param fmt: output format
+        :param disp_action: display control flag
+        """
+        print_method: str | None = self._PRINT_METHODS.get(fmt)
+        if print_method is None:
+            print("---")
+        else:
+            getattr(devices, print_method)(disp_action)
 
     def run_info(  # noqa: C901
         self,
@@ -555,7 +771,7 @@ class TangoControl:
         :return: error condition
         """
         rc: int
-        devices: TangoctlDevices
+        devices: TangoctlDevices | None
 
         self.logger.info(
             "Info display aktion %d : device %s attribute %s command %s property %s",
@@ -566,8 +782,17 @@ class TangoControl:
             tgo_prop,
         )
 
+        no_filter: bool = tgo_attrib is None and tgo_cmd is None and tgo_prop is None
+
+        if tgo_name is None and no_filter and disp_action == 0 and evrythng is False:
+            self.logger.error(
+                "No filters specified, use '-l' flag to list all devices"
+                " or '-e' for a full display of every device in the namespace",
+            )
+            return 1
+
         # List Tango devices
-        if disp_action == 4 and tgo_attrib is None and tgo_cmd is None and tgo_prop is None:
+        if disp_action == 4 and no_filter:
             rc = self.list_devices(
                 file_name,
                 fmt,
@@ -585,58 +810,33 @@ class TangoControl:
             return rc
 
         if file_name is not None:
-            if os.path.splitext(file_name)[-1] != f".{fmt}":
-                file_name = f"{file_name}.{fmt}"
+            suffix = self._FILE_SUFFIXES.get(fmt) or f".{fmt}"
+            if not file_name.endswith(suffix):
+                file_name += suffix
                 self.logger.warning("File name changed to %s", file_name)
 
-        if (
-            tgo_name is None
-            and tgo_attrib is None
-            and tgo_cmd is None
-            and tgo_prop is None
-            and (not disp_action)
-            and (not evrythng)
-        ):
-            self.logger.error(
-                "No filters specified, use '-l' flag to list all devices"
-                " or '-e' for a full display of every device in the namespace",
-            )
-            return 1
-
         # Read devices while applying filters
-        try:
-            devices = TangoctlDevices(
-                self.logger,
-                uniq_cls,
-                quiet_mode,
-                reverse,
-                evrythng,
-                self.cfg_data,
-                tgo_name,
-                tgo_attrib,
-                tgo_cmd,
-                tgo_prop,
-                file_name,
-                fmt,
-            )
-        except tango.ConnectionFailed:
-            self.logger.error("Tango connection for info failed")
+        devices = self._make_devices(
+            uniq_cls,
+            quiet_mode,
+            reverse,
+            evrythng,
+            tgo_name,
+            tgo_attrib,
+            tgo_cmd,
+            tgo_prop,
+            file_name,
+            fmt,
+            "info",
+        )
+        if devices is None:
             return 1
-        devices.read_device_values()
+        # A text listing only shows the names of the devices that passed the filters
+        if not (fmt == "txt" and disp_action == 4):
+            devices.read_device_values()
 
         self.logger.debug("Read devices (action %d)", disp_action)
 
-        if fmt == "txt":
-            devices.print_txt(disp_action)
-        elif fmt == "html":
-            devices.print_html(disp_action)
-        elif fmt == "json":
-            devices.print_json(disp_action)
-        elif fmt == "md":
-            devices.print_markdown(disp_action)
-        elif fmt == "yaml":
-            devices.print_yaml(disp_action)
-        else:
-            print("---")
+        self.print_devices(devices, fmt, disp_action)
 
         return 0
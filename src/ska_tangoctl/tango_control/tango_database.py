@@ -5,20 +5,85 @@ import functools
 import logging
 import os
 import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, List
 
 import tango
 import tango.gevent
 
+from ska_tangoctl.tango_control.check_tango_device import get_host_ip
 from ska_tangoctl.tango_kontrol.tango_kontrol import get_namespaces_list
 
-Device = functools.lru_cache(maxsize=1024)(tango.gevent.DeviceProxy)
-DeviceInfo = collections.namedtuple("DeviceInfo", ("name", "server", "klass", "alias", "exported"))
-DatabaseInfo = collections.namedtuple(
-    "DatabaseInfo", ("name", "host", "port", "servers", "devices", "aliases")
-)
-ServerInfo = collections.namedtuple("ServerInfo", ("name", "type", "instance", "host", "devices"))
+_module_logger = logging.getLogger(__name__)
+
+_device_proxy = functools.lru_cache(maxsize=1024)(tango.gevent.DeviceProxy)
+
+
+def Device(dev_name: str) -> Any:
+    """
+    Get device proxy, reusing the one made earlier for the same device.
+
+    Tango device names are not case sensitive and the tango:// prefix is optional,
+    so the name is normalised before it is looked up. The least recently used
+    proxies are dropped once there are more than 1024 of them.
+
+    :param dev_name: device name, optionally with database host and port
+    :return: device proxy
+    """
+    dev_name = dev_name.lower()
+    if dev_name.startswith("tango://"):
+        dev_name = dev_name[8:]
+    return _device_proxy(dev_name)
+
+
+# Drop all proxies, e.g. when switching to another Tango host
+Device.cache_clear = _device_proxy.cache_clear  # type: ignore[attr-defined]
+
+
+# Not frozen: a frozen dataclass is several times slower to make, and there is one per device
+@dataclass(slots=True)
+class DeviceInfo:
+    """Device as listed in the Tango database."""
+
+    name: str
+    server: str
+    klass: str
+    alias: str | None
+    exported: bool | None
+    # Lowercase names are used for sorting and filtering, so the builders set them once
+    name_lower: str
+    alias_lower: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class DatabaseInfo:
+    """Servers and devices in the Tango database."""
+
+    name: str
+    host: str
+    port: int
+    servers: dict
+    devices: dict
+    aliases: dict
+    # Devices in order of their keys in devices, sorted once when the database is read
+    sorted_devices: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class ServerInfo:
+    """Device server as listed in the Tango database."""
+
+    name: str
+    type: str
+    instance: str
+    host: str | None
+    devices: list
+
+
+CacheInfo = collections.namedtuple("CacheInfo", ("hits", "misses", "maxsize", "currsize"))
 
 
 class TangoHostInfo:
@@ -48,15 +113,14 @@ class TangoHostInfo:
         self.ns_name: str | None
 
         if tango_host is not None:
-            self.tango_fqdn = tango_host.split(":")[0]
-            self.tango_port = int(tango_host.split(":")[1])
+            self.tango_fqdn, _sep, tango_port_str = tango_host.rpartition(":")
+            self.tango_port = int(tango_port_str)
             self.tango_host = tango_host
         else:
             self.tango_fqdn = tango_fqdn
             self.tango_port = tango_port
             try:
-                tango_addr = socket.gethostbyname_ex(tango_fqdn)
-                self.tango_ip = tango_addr[2][0]
+                self.tango_ip = get_host_ip(tango_fqdn)
                 if use_fqdn:
                     self.tango_host = f"{self.tango_fqdn}:{tango_port}"
                 else:
@@ -109,6 +173,16 @@ def get_db_name(db: Any) -> str:
     return "{}:{}".format(db.get_db_host(), db.get_db_port())
 
 
+def _sorted_devices(devices: dict) -> tuple:
+    """
+    Sort devices by name.
+
+    :param devices: devices, keyed by name
+    :return: devices in order of name
+    """
+    return tuple(devices[dev_name] for dev_name in sorted(devices))
+
+
 def _build_db_standard(db: Any = None) -> DatabaseInfo:
     """
     Build database string.
@@ -118,14 +192,26 @@ def _build_db_standard(db: Any = None) -> DatabaseInfo:
     """
     db = get_db(db)
     all_servers, all_devices = {}, {}
-    for server_id in db.get_server_list():
+    server_ids = list(db.get_server_list())
+    host, port = db.get_db_host(), db.get_db_port_num()
+    # Database handles are not shared between threads, each worker makes its own
+    worker_dbs = threading.local()
+
+    def _worker_server_devices(server_id: str) -> Any:
+        worker_db = getattr(worker_dbs, "db", None)
+        if worker_db is None:
+            worker_db = worker_dbs.db = tango.Database(host, port)
+        return _get_server_devices(server_id, db=worker_db)
+
+    # One database call per server, so keep several of them in flight
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        server_devices = list(executor.map(_worker_server_devices, server_ids))
+    for server_id, devices in zip(server_ids, server_devices):
         server_type, server_instance = server_id.split("/", 1)
-        devices = _get_server_devices(server_id, db=db)
         all_devices.update(devices)
         device_names = list(devices)
         server = ServerInfo(server_id, server_type, server_instance, None, device_names)
         all_servers[server_id] = server
-    host, port = db.get_db_host(), db.get_db_port_num()
     name = "{}:{}".format(host, port)
     return DatabaseInfo(
         servers=all_servers,
@@ -134,6 +220,7 @@ def _build_db_standard(db: Any = None) -> DatabaseInfo:
         port=port,
         aliases={},
         name=name,
+        sorted_devices=_sorted_devices(all_devices),
     )
 
 
@@ -147,17 +234,37 @@ def _build_db_quick(db_dev: Any) -> DatabaseInfo:
     all_servers: dict
     all_devices: dict
     aliases: dict
+    classes: dict[str, str] = {}
 
     query = "SELECT name, alias, exported, host, server, class FROM device"
     r = db_dev.DbMySqlSelect(query)
     row_nb, column_nb = r[0][-2:]
     data = r[1]
-    assert row_nb == len(data) // column_nb
+    db = db_dev.get_device_db()
+    host, port = db.get_db_host(), db.get_db_port_num()
+    name = "{}:{}".format(host, port)
     all_servers, all_devices, aliases = {}, {}, {}
-    for row in range(row_nb):
-        idx = row * column_nb
-        cells = data[idx : idx + column_nb]
-        dev_name, dev_alias, exported, host, server_id, klass = cells
+    # Do not try to parse a result that does not have the expected shape
+    if not column_nb or row_nb != len(data) // column_nb:
+        _module_logger.warning(
+            "Database %s returned %d values for %d rows of %d columns",
+            name,
+            len(data),
+            row_nb,
+            column_nb,
+        )
+        return DatabaseInfo(
+            servers=all_servers,
+            devices=all_devices,
+            aliases=aliases,
+            host=host,
+            port=port,
+            name=name,
+            sorted_devices=(),
+        )
+    # The result is flat, so take every column with a stride and zip the rows together
+    columns = [data[col::column_nb] for col in range(column_nb)]
+    for dev_name, dev_alias, exported, dev_host, server_id, klass in zip(*columns):
         # handle garbage:
         if not server_id or server_id.count("/") != 1:
             continue
@@ -167,17 +274,24 @@ def _build_db_quick(db_dev: Any) -> DatabaseInfo:
             dev_alias = None
         else:
             aliases[dev_alias] = dev_name
-        device = DeviceInfo(dev_name, server_id, klass, dev_alias, bool(int(exported)))
         server = all_servers.get(server_id)
         if server is None:
             server_type, server_instance = server_id.split("/", 1)
-            server = ServerInfo(server_id, server_type, server_instance, host, [])
+            server = ServerInfo(server_id, server_type, server_instance, dev_host, [])
             all_servers[server_id] = server
         server.devices.append(dev_name)
-        all_devices[dev_name.lower()] = device
-    db = db_dev.get_device_db()
-    host, port = db.get_db_host(), db.get_db_port_num()
-    name = "{}:{}".format(host, port)
+        # Every row has its own copy of the strings, keep one per server and class
+        klass = classes.setdefault(klass, klass)
+        dev_name_lower = dev_name.lower()
+        all_devices[dev_name_lower] = DeviceInfo(
+            dev_name,
+            server.name,
+            klass,
+            dev_alias,
+            bool(int(exported)),
+            dev_name_lower,
+            dev_alias.lower() if dev_alias else None,
+        )
     return DatabaseInfo(
         servers=all_servers,
         devices=all_devices,
@@ -185,6 +299,7 @@ def _build_db_quick(db_dev: Any) -> DatabaseInfo:
         host=host,
         port=port,
         name=name,
+        sorted_devices=_sorted_devices(all_devices),
     )
 
 
@@ -198,40 +313,125 @@ def _build_db(db: Any = None) -> DatabaseInfo:
     db = get_db(db)
     db_dev_name = "{}/{}".format(get_db_name(db), db.dev_name())
     db_dev = Device(db_dev_name)
+    # One bulk query is much quicker than a query per server, so try that first
     if hasattr(db_dev, "DbMySqlSelect"):
-        return _build_db_quick(db_dev)
-    else:
-        return _build_db_standard(db=db)
+        try:
+            return _build_db_quick(db_dev)
+        except tango.DevFailed as t_err:
+            _module_logger.warning(
+                "Could not query database %s, read servers one at a time: %s",
+                db_dev_name,
+                t_err.args[0].desc.strip() if t_err.args else t_err,
+            )
+    return _build_db_standard(db=db)
+
+
+# Separates positional from keyword arguments in cache keys
+_KWD_MARK = object()
 
 
 def timed_lru_cache(seconds: int, maxsize: int = 128) -> Any:
     """
-    Implement timed LRU cache.
+    Implement timed LRU cache, where each entry expires on its own.
 
-    :param seconds: number of seconds
+    :param seconds: number of seconds for which an entry is used
     :param maxsize: maximum size
     :return: magic thing
     """
 
     def _wrapper(func: Any) -> Any:
-        func = functools.lru_cache(maxsize=maxsize, typed=False)(func)
-        func._created = time.monotonic()
-        func._expired = lambda: time.monotonic() >= (func._created + seconds)
+        cache: collections.OrderedDict = collections.OrderedDict()
+        stats: list[int] = [0, 0]  # hits, misses
 
         @functools.wraps(func)
         def _wrapped(*args: Any, **kwargs: Any) -> Any:
-            if func._expired():
-                func.cache_clear()
-                func._created = time.monotonic()
-            return func(*args, **kwargs)
-
-        _wrapped.cache_info = func.cache_info  # type: ignore[attr-defined]
-        _wrapped.cache_clear = func.cache_clear  # type: ignore[attr-defined]
+            # Calls without keyword arguments, the usual case, use the arguments as they are
+            key = args + (_KWD_MARK, frozenset(kwargs.items())) if kwargs else args
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and now < entry[1]:
+                cache.move_to_end(key)
+                stats[0] += 1
+                return entry[0]
+            stats[1] += 1
+            value = func(*args, **kwargs)
+            cache[key] = (value, now + seconds)
+            cache.move_to_end(key)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return value
+
+        def _cache_info() -> Any:
+            return CacheInfo(stats[0], stats[1], maxsize, len(cache))
+
+        def _cache_clear() -> None:
+            cache.clear()
+            stats[0] = stats[1] = 0
+
+        _wrapped.cache_info = _cache_info  # type: ignore[attr-defined]
+        _wrapped.cache_clear = _cache_clear  # type: ignore[attr-defined]
         return _wrapped
 
     return _wrapper
 
 
+@timed_lru_cache(10)
+def _cached_build_db(db_host: str, db_port: int) -> DatabaseInfo:
+    """
+    Build database information, shared by all handles for the same database.
+
+    :param db_host: database host
+    :param db_port: database port number
+    :return: database information
+    """
+    return _build_db(tango.Database(db_host, db_port))
+
+
+class _DbProxy:
+    """Tango database handle, with database information cached per host and port."""
+
+    __slots__ = ("_db",)
+
+    def __init__(self, db: Any):
+        """
+        Wrap the database handle.
+
+        :param db: Tango database handle
+        """
+        self._db = db
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Pass everything else on to the database handle.
+
+        :param name: attribute name
+        :return: attribute of the database handle
+        """
+        return getattr(self._db, name)
+
+    def get_db_info(self) -> DatabaseInfo:
+        """
+        Get database information.
+
+        :return: database information
+        """
+        return _cached_build_db(self._db.get_db_host(), self._db.get_db_port_num())
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_db_name(db_name: str) -> tuple[str, int]:
+    """
+    Split database name into host and port.
+
+    :param db_name: database host, with or without port number
+    :return: host and port, which is 10000 if not given
+    """
+    host, sep, port_str = db_name.rpartition(":")
+    if not sep:
+        return db_name, 10000
+    return host, int(port_str)
+
+
 def Database(db_name: Any = None) -> Any:
     """
     Get database handle.
@@ -242,23 +442,8 @@ def Database(db_name: Any = None) -> Any:
     if db_name is None:
         db = tango.Database()
     else:
-        if ":" in db_name:
-            host, port = db_name.rsplit(":", 10000)
-            port = int(port)
-        else:
-            host, port = db_name, 10000
-        db = tango.Database(host, port)
-
-    def build_database() -> Any:
-        """
-        Build database thing.
-
-        :return: the thing
-        """
-        return _build_db(db)
-
-    db.get_db_info = timed_lru_cache(10)(build_database)
-    return db
+        db = tango.Database(*_parse_db_name(db_name))
+    return _DbProxy(db)
 
 
 def get_db(db: Any = None) -> Any:
@@ -294,11 +479,48 @@ def _get_server_devices(server_id: Any, db: Any = None) -> Any:
     db = get_db(db)
     class_list = db.get_device_class_list(server_id)
     return {
-        name: DeviceInfo(name, server_id, klass, alias=None, exported=None)
+        name: DeviceInfo(
+            name,
+            server_id,
+            klass,
+            alias=None,
+            exported=None,
+            name_lower=name.lower(),
+            alias_lower=None,
+        )
         for name, klass in zip(class_list[::2], class_list[1::2])
     }
 
 
+def _make_tango_hosts(
+    kube_namespaces: list[str],
+    databaseds_name: str | None,
+    cluster_domain: str | None,
+    databaseds_port: int,
+    use_fqdn: bool,
+) -> list[TangoHostInfo]:
+    """
+    Look up the Tango hosts for several namespaces at the same time.
+
+    :param kube_namespaces: K8S namespaces
+    :param databaseds_name: Tango host prefix
+    :param cluster_domain: Tango host domain name
+    :param databaseds_port: Tango host port number
+    :param use_fqdn: use IP address instead of FQDN
+    :return: host information, in the same order as the namespaces
+    """
+
+    def _make_host(ns_name: str) -> TangoHostInfo:
+        tango_fqdn = f"{databaseds_name}.{ns_name}.svc.{cluster_domain}"
+        return TangoHostInfo(None, tango_fqdn, databaseds_port, ns_name, use_fqdn)
+
+    if len(kube_namespaces) < 2:
+        return [_make_host(ns_name) for ns_name in kube_namespaces]
+    # Name lookups spend their time waiting on the network, so overlap them
+    with ThreadPoolExecutor(max_workers=min(16, len(kube_namespaces))) as executor:
+        return list(executor.map(_make_host, kube_namespaces))
+
+
 def get_tango_hosts(
     logger: logging.Logger,
     tango_host: str | None,
@@ -320,7 +542,6 @@ def get_tango_hosts(
     :param use_fqdn: use IP address instead of FQDN
     :return: list of hosts
     """
-    tango_fqdn: str
     thost: TangoHostInfo
     tango_hosts: List[TangoHostInfo] = []
     logger.info("Get host for namespace %s", kube_namespace)
@@ -329,7 +550,10 @@ def get_tango_hosts(
         thost = TangoHostInfo(tango_host, "", 0, None, use_fqdn)
         logger.info("Set host to %s", thost)
         tango_hosts.append(thost)
-    elif kube_namespace is None:
+        return tango_hosts
+
+    kube_namespaces: list[str]
+    if kube_namespace is None:
         kube_namespace = os.getenv("KUBE_NAMESPACE")
         if kube_namespace is None:
             print(
@@ -337,31 +561,20 @@ def get_tango_hosts(
                 " TANGO_HOST and KUBE_NAMESPACE not set"
             )
             return tango_hosts
-        tango_fqdn = f"{databaseds_name}.{kube_namespace}.svc.{cluster_domain}"
-        thost = TangoHostInfo(None, tango_fqdn, databaseds_port, kube_namespace, use_fqdn)
+        kube_namespaces = [kube_namespace]
+    elif "," in kube_namespace:
+        kube_namespaces = kube_namespace.split(",")
+    else:
+        kube_namespaces = get_namespaces_list(logger, kube_namespace)
+    for kube_namespace, thost in zip(
+        kube_namespaces,
+        _make_tango_hosts(
+            kube_namespaces, databaseds_name, cluster_domain, databaseds_port, use_fqdn
+        ),
+    ):
         if thost.tango_host is not None:
-            logger.info("Set host for namespace %s to %s", kube_namespace, thost)
+            logger.info("Add host for namespace %s : %s", kube_namespace, thost)
             tango_hosts.append(thost)
         else:
             logger.info("No host for namespace %s", kube_namespace)
-    elif "," in kube_namespace:
-        kube_namespaces: list[str] = kube_namespace.split(",")
-        for kube_namespace in kube_namespaces:
-            tango_fqdn = f"{databaseds_name}.{kube_namespace}.svc.{cluster_domain}"
-            thost = TangoHostInfo(None, tango_fqdn, databaseds_port, kube_namespace, use_fqdn)
-            if thost.tango_host is not None:
-                logger.info("List host for namespace %s : %s", kube_namespace, thost)
-                tango_hosts.append(thost)
-            else:
-                logger.info("No host for namespace %s", kube_namespace)
-    else:
-        namespaces_list: list = get_namespaces_list(logger, kube_namespace)
-        for kube_namespace in namespaces_list:
-            tango_fqdn = f"{databaseds_name}.{kube_namespace}.svc.{cluster_domain}"
-            thost = TangoHostInfo(None, tango_fqdn, databaseds_port, kube_namespace, use_fqdn)
-            if thost.tango_host is not None:
-                logger.info("Add host for namespace %s : %s", kube_namespace, thost)
-                tango_hosts.append(thost)
-            else:
-                logger.info("No host for namespace %s", kube_namespace)
     return tango_hosts
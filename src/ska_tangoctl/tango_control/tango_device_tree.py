@@ -1,9 +1,11 @@
 """Display tree of servers."""
 
-import collections
 import fnmatch
-import functools
-from typing import Any
+import itertools
+import operator
+import re
+import sys
+from typing import Any, Callable
 
 from ska_tangoctl.tango_control.tango_database import (
     _server_host_str,
@@ -12,6 +14,9 @@ from ska_tangoctl.tango_control.tango_database import (
     get_db_info,
 )
 
+# Devices left out of the tree unless asked for, e.g. the database and admin devices
+_EXCLUDE_PREFIXES = ("sys", "dserver")
+
 
 def _device_class_str(dev: Any) -> str:
     """
@@ -77,6 +82,59 @@ def fnmatch_any(name: str, patterns: Any, case_insensitive: bool = False) -> Any
     return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
 
 
+def _compile_patterns(patterns: Any, case_insensitive: bool = False) -> Callable[[str], Any]:
+    """
+    Make a function that checks if name matches any of those in the list of patterns.
+
+    :param patterns: match this
+    :param case_insensitive: uppercase or lowercase
+    :return: function that takes a name and returns a match, or None
+    """
+    if not patterns:
+        return lambda name: True
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    flags = re.IGNORECASE if case_insensitive else 0
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns), flags).match
+
+
+def _device_filter(
+    device: Any, server: Any, klass: Any, host: Any, include_dserver: bool, servers: dict
+) -> Callable[[Any], bool]:
+    """
+    Make a function that checks if a device passes all the filters.
+
+    :param device: device name
+    :param server: server name
+    :param klass: device class
+    :param host: hostname
+    :param include_dserver: include devices that start with 'dserver' or 'sys'
+    :param servers: servers in the database, keyed by name
+    :return: function that takes a device and returns True if it should be shown
+    """
+    # Translate the patterns once, rather than for every device
+    match_device = _compile_patterns(device, case_insensitive=True)
+    match_klass = _compile_patterns(klass)
+    match_server = _compile_patterns(server)
+    match_host = _compile_patterns(host, case_insensitive=True)
+
+    def _match(d: Any) -> bool:
+        if not include_dserver:
+            # if d.klass == "DServer":
+            #     return False
+            if d.name_lower.startswith(_EXCLUDE_PREFIXES):
+                return False
+        if not (match_device(d.name_lower) or (d.alias_lower and match_device(d.alias_lower))):
+            return False
+        return bool(
+            match_klass(d.klass)
+            and match_server(d.server)
+            and match_host(servers[d.server].host or "")
+        )
+
+    return _match
+
+
 def iter_devices(
     device: Any = None,
     server: Any = None,
@@ -101,25 +159,32 @@ def iter_devices(
     db = get_db(db)
     db_info = get_db_info(db=db)
 
-    devs, servers = db_info.devices, db_info.servers
-    devices = (devs[dname] for dname in sorted(devs, reverse=reverse))
-    if not include_dserver:
-        # devices = (d for d in devices if d.klass != "DServer")
-        devices = (
-            d for d in devices if d.name[0:3].lower() != "sys" and d.name[0:7].lower() != "dserver"
-        )
-    devices = (
-        d
-        for d in devices
-        if fnmatch_any(d.name, device, case_insensitive=True)
-        or (d.alias and fnmatch_any(d.alias, device, case_insensitive=True))
-    )
-    devices = (d for d in devices if fnmatch_any(d.klass, klass))
-    devices = (d for d in devices if fnmatch_any(d.server, server))
-    devices = (d for d in devices if fnmatch_any(servers[d.server], host, case_insensitive=True))
+    devs = db_info.sorted_devices
+    match = _device_filter(device, server, klass, host, include_dserver, db_info.servers)
+    devices = filter(match, reversed(devs) if reverse else devs)
     return devices
 
 
+def _domain_key(row: tuple) -> str:
+    """
+    Get domain of device row.
+
+    :param row: lowercase domain, family and member, and device
+    :return: domain
+    """
+    return row[0][0]
+
+
+def _family_key(row: tuple) -> str:
+    """
+    Get family of device row.
+
+    :param row: lowercase domain, family and member, and device
+    :return: family
+    """
+    return row[0][1]
+
+
 def device_tree(
     device: Any = None,
     server: Any = None,
@@ -144,33 +209,33 @@ def device_tree(
     db = None
     db_info = get_db_info(db=db)
 
-    import treelib  # type: ignore[import-untyped]
-
-    tree = treelib.Tree()
-    db_node = tree.create_node(db_info.name)
     all_servers = db_info.servers
-    devices = iter_devices(
-        device=device,
-        klass=klass,
-        server=server,
-        host=host,
-        include_dserver=include_dserver,
-        reverse=reverse,
-        db=db,
-    )
-    domains: Any = collections.defaultdict(functools.partial(collections.defaultdict, dict))
-    for dev in devices:
-        d, f, m = dev.name.split("/")
-        domains[d.lower()][f.lower()][m.lower()] = dev
-    for domain in sorted(domains, reverse=reverse):
-        d_node = tree.create_node(_device_str(domain), parent=db_node)
-        families = domains[domain]
-        for family in sorted(families, reverse=reverse):
-            f_node = tree.create_node(_device_str(family), parent=d_node)
-            members = families[family]
-            for member in sorted(members, reverse=reverse):
+    # Filter the devices in one pass, then sort them by domain, family and member
+    match = _device_filter(device, server, klass, host, include_dserver, all_servers)
+    rows = []
+    for dev in db_info.sorted_devices:
+        if not match(dev):
+            continue
+        rows.append((tuple(dev.name_lower.split("/")), dev))
+    rows.sort(key=operator.itemgetter(0), reverse=reverse)
+    # Draw the tree line by line, rather than making a node for every device
+    lines = [db_info.name]
+    domain_groups = [
+        (domain, list(d_rows)) for domain, d_rows in itertools.groupby(rows, key=_domain_key)
+    ]
+    for d_n, (domain, d_rows) in enumerate(domain_groups, 1):
+        d_last = d_n == len(domain_groups)
+        lines.append(("└── " if d_last else "├── ") + _device_str(domain))
+        d_indent = "    " if d_last else "│   "
+        family_groups = [
+            (family, list(f_rows)) for family, f_rows in itertools.groupby(d_rows, key=_family_key)
+        ]
+        for f_n, (family, f_rows) in enumerate(family_groups, 1):
+            f_last = f_n == len(family_groups)
+            lines.append(d_indent + ("└── " if f_last else "├── ") + _device_str(family))
+            f_indent = d_indent + ("    " if f_last else "│   ")
+            for m_n, ((_d, _f, member), dev) in enumerate(f_rows, 1):
                 if verbose:
-                    dev = members[member]
                     srv = all_servers[dev.server]
                     text = verbose_template.format(
                         _device_str(member),
@@ -182,5 +247,6 @@ def device_tree(
                     )
                 else:
                     text = member
-                tree.create_node(text, parent=f_node)
-    print(str(tree))
+                lines.append(f_indent + ("└── " if m_n == len(f_rows) else "├── ") + text)
+    lines.append("\n")
+    sys.stdout.write("\n".join(lines))
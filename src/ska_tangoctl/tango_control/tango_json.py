@@ -8,6 +8,11 @@ import re
 import sys
 from typing import Any, TextIO
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
 
 def progress_bar(
     iterable: list | dict,
@@ -71,6 +76,95 @@ def progress_bar(
             yield item
 
 
+def _json_default(obj: Any) -> Any:
+    """
+    Convert numpy arrays and scalars for the standard library JSON encoder.
+
+    :param obj: value that the encoder does not know about
+    :return: list or number
+    :raises TypeError: when the value can not be converted
+    """
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(data: Any, indent: int | None = 2) -> str:
+    """
+    Serialize data to JSON, using orjson where it is installed.
+
+    orjson only knows about 2-space indentation, so other values are passed
+    on to the standard library encoder.
+
+    :param data: dictionary, list, etc.
+    :param indent: indentation, or None for compact output
+    :return: JSON string
+    """
+    if orjson is not None and indent in (None, 2):
+        opts: int = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            opts |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=opts).decode()
+    # Match the orjson output: compact separators and numpy values as lists or numbers
+    return json.dumps(
+        data,
+        indent=indent,
+        separators=(",", ":") if indent is None else None,
+        default=_json_default,
+    )
+
+
+def json_loads(data: bytes | str) -> Any:
+    """
+    Parse JSON, using orjson where it is installed.
+
+    :param data: JSON text
+    :return: dictionary, list, etc.
+    :raises ValueError: when the input is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def yaml_dumps(data: Any) -> str:
+    """
+    Serialize data to YAML.
+
+    :param data: dictionary, list, etc.
+    :return: YAML string
+    """
+    # PyYAML is only imported when YAML output is asked for
+    import yaml
+
+    # Use the libyaml emitter where PyYAML was built with it, not the safe one, since
+    # device data has values such as DevState and numpy arrays
+    return yaml.dump(data, Dumper=getattr(yaml, "CDumper", yaml.Dumper))
+
+
+def json_print(data: Any, outf: TextIO | None = None) -> None:
+    """
+    Write data as indented JSON, followed by a newline.
+
+    Where orjson is installed, the encoded bytes go straight to the binary
+    buffer underneath the stream.
+
+    :param data: dictionary, list, etc.
+    :param outf: output stream, defaults to standard output
+    """
+    if outf is None:
+        outf = sys.stdout
+    buf = getattr(outf, "buffer", None)
+    if orjson is None or buf is None:
+        outf.write(json_dumps(data))
+        outf.write("\n")
+        return
+    outf.flush()
+    buf.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+    buf.write(b"\n")
+    buf.flush()
+
+
 def md_format(inp: str) -> str:
     """
     Change string to safe format.
@@ -166,7 +260,7 @@ class TangoJsonReader:
                 if "'" in dstr:
                     dstr = dstr.replace("'", '"')
                 try:
-                    ddict = json.loads(dstr)
+                    ddict = json_loads(dstr)
                 except json.decoder.JSONDecodeError as jerr:
                     # TODO this string breaks it
                     # {
@@ -178,7 +272,8 @@ class TangoJsonReader:
                     self.logger.info("Could not read %s- : %s", dstr, str(jerr))
                     print(f"| {dstr:143} ||", file=self.outf)
                     return
-                self.logger.debug("Print JSON :\n%s", json.dumps(ddict, indent=4))
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Print JSON :\n%s", json_dumps(ddict))
                 n = 0
                 for ditem in ddict:
                     if n:
@@ -430,7 +525,7 @@ class TangoJsonReader:
                 if "'" in dstr:
                     dstr = dstr.replace("'", '"')
                 try:
-                    ddict = json.loads(dstr)
+                    ddict = json_loads(dstr)
                 except json.decoder.JSONDecodeError as jerr:
                     # TODO this string breaks it
                     # {
@@ -442,7 +537,8 @@ class TangoJsonReader:
                     self.logger.info("Could not read %s- : %s", dstr, str(jerr))
                     print(f"<pre>{dstr}</pre>", file=self.outf)
                     return
-                self.logger.debug("Print JSON :\n%s", json.dumps(ddict, indent=4))
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Print JSON :\n%s", json_dumps(ddict))
                 for ditem in ddict:
                     print(f'<table><tr><td class="tangoctl">{ditem}</td>', file=self.outf)
                     if type(ddict[ditem]) is dict:
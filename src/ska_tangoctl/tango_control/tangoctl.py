@@ -2,296 +2,504 @@
 """Read all information about Tango devices."""
 
 import getopt
-import json
 import logging
 import os
 import sys
-from typing import Any, TextIO
+from typing import TYPE_CHECKING, Any, Callable, Final
 
 from ska_tangoctl import __version__
 from ska_tangoctl.tango_control.tango_control import TangoControl
-from ska_tangoctl.tango_control.tango_device_tree import device_tree
+from ska_tangoctl.tango_control.tango_json import json_loads
 from ska_tangoctl.tango_control.tangoctl_config import TANGOCTL_CONFIG
-from ska_tangoctl.tango_control.test_tango_device import TestTangoDevice
-from ska_tangoctl.tla_jargon.tla_jargon import print_jargon
+
+if TYPE_CHECKING:
+    from ska_tangoctl.tango_control.test_tango_device import TestTangoDevice
 
 logging.basicConfig(level=logging.WARNING)
 _module_logger = logging.getLogger("tango_control")
 _module_logger.setLevel(logging.WARNING)
 
 
+class TangoctlOptions:
+    """Settings read from the command line."""
+
+    __slots__ = (
+        "cfg_name",
+        "dev_admin",
+        "dev_off",
+        "dev_on",
+        "dev_sim",
+        "dev_standby",
+        "dev_status",
+        "dev_test",
+        "disp_action",
+        "dry_run",
+        "evrythng",
+        "fmt",
+        "input_file",
+        "json_dir",
+        "output_file",
+        "quiet_mode",
+        "show_attrib",
+        "show_command",
+        "show_jargon",
+        "show_tango",
+        "show_tree",
+        "show_version",
+        "tango_host",
+        "tango_port",
+        "tgo_attrib",
+        "tgo_cmd",
+        "tgo_in_type",
+        "tgo_name",
+        "tgo_prop",
+        "tgo_value",
+        "uniq_cls",
+    )
+
+    def __init__(self) -> None:
+        """Set default values."""
+        self.cfg_name: str | None = None
+        self.dev_admin: int | None = None
+        self.dev_off: bool = False
+        self.dev_on: bool = False
+        self.dev_sim: int | None = None
+        self.dev_standby: bool = False
+        self.dev_status: bool = False
+        self.dev_test: bool = False
+        self.disp_action: int = 0
+        self.dry_run: bool = False
+        self.evrythng: bool = False
+        self.fmt: str = "txt"
+        self.input_file: str | None = None
+        self.json_dir: str | None = None
+        self.output_file: str | None = None
+        self.quiet_mode: bool = False
+        self.show_attrib: bool = False
+        self.show_command: bool = False
+        self.show_jargon: bool = False
+        self.show_tango: bool = False
+        self.show_tree: bool = False
+        self.show_version: bool = False
+        self.tango_host: str | None = None
+        self.tango_port: int = 10000
+        self.tgo_attrib: str | None = None
+        self.tgo_cmd: str | None = None
+        # TODO Feature to search by input type not implemented yet
+        self.tgo_in_type: str | None = None
+        self.tgo_name: str | None = None
+        self.tgo_prop: str | None = None
+        self.tgo_value: str | None = None
+        self.uniq_cls: bool = False
+
+
+# Options recognised on the command line, in the format expected by getopt
+_SHORT_OPTS: Final[str] = "abcdefhjklmnoqstuvwyVA:C:H:D:I:J:p:O:P:T:W:X:"
+_LONG_OPTS: Final[tuple[str, ...]] = (
+    "class",
+    "cmd",
+    "dry-run",
+    "everything",
+    "full",
+    "help",
+    "html",
+    "json",
+    "list",
+    "md",
+    "off",
+    "on",
+    "quiet",
+    "standby",
+    "status",
+    "short",
+    "show-acronym",
+    "show-db",
+    "show-dev",
+    "tree",
+    "unique",
+    "version",
+    "yaml",
+    "admin=",
+    "attribute=",
+    "cfg=",
+    "command=",
+    "device=",
+    "help-topic=",
+    "host=",
+    "input=",
+    "json-dir=",
+    "k8s-ns=",
+    "output=",
+    "port=",
+    "property=",
+    "simul=",
+    "type=",
+    "value=",
+)
+
+
+def _build_long_prefixes(long_opts: tuple[str, ...]) -> dict[str, str | None]:
+    """
+    Map every abbreviation of the long options to the full option.
+
+    :param long_opts: long options in getopt format
+    :return: dictionary with abbreviation and option, or None if it is ambiguous
+    """
+    prefixes: dict[str, str | None] = {}
+    names: list[str] = [opt.rstrip("=") for opt in long_opts]
+    name: str
+    n: int
+
+    for name in names:
+        # Start with the empty prefix, so that "--=x" is ambiguous as it is for getopt
+        for n in range(len(name)):
+            prefix = name[:n]
+            prefixes[prefix] = None if prefix in prefixes else name
+    # Exact matches win over abbreviations of longer options
+    for name in names:
+        prefixes[name] = name
+    return prefixes
+
+
+# Lookup tables for the command line parser, built once from the getopt specifications
+_SHORT_TAKES_ARG: Final[dict[str, bool]] = {
+    opt: _SHORT_OPTS[n + 1 : n + 2] == ":" for n, opt in enumerate(_SHORT_OPTS) if opt != ":"
+}
+_LONG_TAKES_ARG: Final[dict[str, bool]] = {
+    opt.rstrip("="): opt.endswith("=") for opt in _LONG_OPTS
+}
+_LONG_PREFIXES: Final[dict[str, str | None]] = _build_long_prefixes(_LONG_OPTS)
+
+
+def _parse_long_option(arg: str, argv: list[str], n: int) -> tuple[tuple[str, str], int]:
+    """
+    Read one long option, with its value if it takes one.
+
+    :param arg: option, starting with "--"
+    :param argv: command line arguments
+    :param n: index of the argument after this option
+    :return: option with value, and index of the next argument
+    :raises GetoptError: when the option is unknown or the value is missing
+    """
+    name, eq, value = arg[2:].partition("=")
+    full_name = _LONG_PREFIXES.get(name, "")
+    if full_name is None:
+        raise getopt.GetoptError(f"option --{name} not a unique prefix", name)
+    if not full_name:
+        raise getopt.GetoptError(f"option --{name} not recognized", name)
+    if not _LONG_TAKES_ARG[full_name]:
+        if eq:
+            raise getopt.GetoptError(f"option --{full_name} must not have an argument", full_name)
+    elif not eq:
+        if n >= len(argv):
+            raise getopt.GetoptError(f"option --{full_name} requires argument", full_name)
+        value = argv[n]
+        n += 1
+    return (f"--{full_name}", value), n
+
+
+def _parse_short_options(arg: str, argv: list[str], n: int, opts: list[tuple[str, str]]) -> int:
+    """
+    Read a group of short options, with the value of the last one if it takes one.
+
+    :param arg: options, starting with "-"
+    :param argv: command line arguments
+    :param n: index of the argument after these options
+    :param opts: list of options with values, updated
+    :return: index of the next argument
+    :raises GetoptError: when an option is unknown or a value is missing
+    """
+    i: int = 1
+    while i < len(arg):
+        opt = arg[i]
+        i += 1
+        takes_arg = _SHORT_TAKES_ARG.get(opt)
+        if takes_arg is None:
+            raise getopt.GetoptError(f"option -{opt} not recognized", opt)
+        if not takes_arg:
+            opts.append((f"-{opt}", ""))
+        elif i < len(arg):
+            opts.append((f"-{opt}", arg[i:]))
+            break
+        elif n < len(argv):
+            opts.append((f"-{opt}", argv[n]))
+            n += 1
+        else:
+            raise getopt.GetoptError(f"option -{opt} requires argument", opt)
+    return n
+
+
+def parse_options(argv: list[str]) -> tuple[list[tuple[str, str]], list[str]]:
+    """
+    Read command line options, like getopt.getopt with the tangoctl options.
+
+    As with getopt, options end at the first argument that is not an option.
+
+    :param argv: command line arguments, without the executable name
+    :return: list of options with values, and remaining arguments
+    """
+    opts: list[tuple[str, str]] = []
+    arg: str
+    long_opt: tuple[str, str]
+    n: int = 0
+
+    while n < len(argv):
+        arg = argv[n]
+        if arg[:1] != "-" or arg == "-":
+            break
+        n += 1
+        if arg == "--":
+            break
+        if arg[:2] == "--":
+            long_opt, n = _parse_long_option(arg, argv, n)
+            opts.append(long_opt)
+        else:
+            n = _parse_short_options(arg, argv, n, opts)
+    return opts, argv[n:]
+
+
+# Command line flags, with the setting they change and the value it is set to
+_FLAG_OPTIONS: dict[str, tuple[str, Any]] = {
+    "-a": ("show_attrib", True),
+    "--class": ("disp_action", 5),
+    "-d": ("disp_action", 5),
+    "--cmd": ("show_command", True),
+    "-c": ("show_command", True),
+    # TODO Undocumented and unused feature for dry runs
+    "--dry-run": ("dry_run", True),
+    "-n": ("dry_run", True),
+    "--everything": ("evrythng", True),
+    "-e": ("evrythng", True),
+    "--full": ("disp_action", 1),
+    "-f": ("disp_action", 1),
+    "--html": ("fmt", "html"),
+    "-w": ("fmt", "html"),
+    "--json": ("fmt", "json"),
+    "-j": ("fmt", "json"),
+    "--list": ("disp_action", 4),
+    "-l": ("disp_action", 4),
+    "--md": ("fmt", "md"),
+    "-m": ("fmt", "md"),
+    "--off": ("dev_off", True),
+    "--on": ("dev_on", True),
+    "--quiet": ("quiet_mode", True),
+    "-q": ("quiet_mode", True),
+    "--short": ("disp_action", 3),
+    "-s": ("disp_action", 3),
+    "--show-db": ("show_tango", True),
+    "-t": ("show_tango", True),
+    "--standby": ("dev_standby", True),
+    "--status": ("dev_status", True),
+    "--test": ("dev_test", True),
+    "--tree": ("show_tree", True),
+    "-b": ("show_tree", True),
+    "--unique": ("uniq_cls", True),
+    "-u": ("uniq_cls", True),
+    "--version": ("show_version", True),
+    "--yaml": ("fmt", "yaml"),
+    "-y": ("fmt", "yaml"),
+}
+
+# Command line options with a value, with the setting they change and how to convert the value
+_VALUE_OPTIONS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "--admin": ("dev_admin", int),
+    "--attribute": ("tgo_attrib", str),
+    "-A": ("tgo_attrib", str),
+    "--cfg": ("cfg_name", str),
+    "-X": ("cfg_name", str),
+    "--command": ("tgo_cmd", str.lower),
+    "-C": ("tgo_cmd", str.lower),
+    "--device": ("tgo_name", str.lower),
+    "-D": ("tgo_name", str.lower),
+    "--host": ("tango_host", str),
+    "-H": ("tango_host", str),
+    "--input": ("input_file", str),
+    "-I": ("input_file", str),
+    "--json-dir": ("json_dir", str),
+    "-J": ("json_dir", str),
+    "--output": ("output_file", str),
+    "-O": ("output_file", str),
+    "--port": ("tango_port", int),
+    "-p": ("tango_port", int),
+    "--property": ("tgo_prop", str.lower),
+    "-P": ("tgo_prop", str.lower),
+    "--simul": ("dev_sim", int),
+    "--value": ("tgo_value", str),
+    "-W": ("tgo_value", str),
+}
+
+
 def main() -> int:  # noqa: C901
     """
     Read and display Tango devices.
 
     :return: error condition
     """
-    dry_run: bool = False
-    tgo_name: str | None = None
-    dev_on: bool = False
-    dev_off: bool = False
-    dev_standby: bool = False
-    dev_status: bool = False
-    dev_test: bool = False
-    dev_admin: int | None = None
-    dev_sim: int | None = None
-    disp_action: int = 0
-    evrythng: bool = False
-    input_file: str | None = None
-    json_dir: str | None = None
-    output_file: str | None = None
-    quiet_mode: bool = False
-    show_attrib: bool = False
-    show_command: bool = False
-    show_jargon: bool = False
-    show_tango: bool = False
-    show_tree: bool = False
-    show_version: bool = False
-    tgo_attrib: str | None = None
-    tgo_cmd: str | None = None
-    # TODO Feature to search by input type not implemented yet
-    tgo_in_type: str | None = None
-    tgo_prop: str | None = None
-    tgo_value: str | None = None
-    tango_host: str | None = None
-    tango_port: int = 10000
-    uniq_cls: bool = False
-    fmt: str = "txt"
+    args: TangoctlOptions = TangoctlOptions()
     tangoctl: TangoControl
     rc: int
     dut: TestTangoDevice
+    flag_opt: tuple[str, Any] | None
+    value_opt: tuple[str, Callable[[str], Any]] | None
 
     # Read configuration
     cfg_data: Any = TANGOCTL_CONFIG
-    cfg_name: str | None = None
+
+    # Answer requests for help or version without reading the rest of the command line,
+    # only the first argument is checked since later ones could be option values
+    if sys.argv[1:2] in (["-h"], ["--help"]):
+        tangoctl = TangoControl(_module_logger, cfg_data)
+        tangoctl.usage(os.path.basename(sys.argv[0]))
+        sys.exit(1)
+    if sys.argv[1:] == ["--version"]:
+        print(f"{os.path.basename(sys.argv[0])} version {__version__}")
+        return 0
 
     try:
-        opts, _args = getopt.getopt(
-            sys.argv[1:],
-            "abcdefhjklmnoqstuvwyVA:C:H:D:I:J:p:O:P:T:W:X:",
-            [
-                "class",
-                "cmd",
-                "dry-run",
-                "everything",
-                "full",
-                "help",
-                "html",
-                "json",
-                "list",
-                "md",
-                "off",
-                "on",
-                "quiet",
-                "standby",
-                "status",
-                "short",
-                "show-acronym",
-                "show-db",
-                "show-dev",
-                "tree",
-                "unique",
-                "version",
-                "yaml",
-                "admin=",
-                "attribute=",
-                "cfg=",
-                "command=",
-                "device=",
-                "host=",
-                "input=",
-                "json-dir=",
-                "k8s-ns=",
-                "output=",
-                "port=",
-                "property=",
-                "simul=",
-                "type=",
-                "value=",
-            ],
-        )
+        opts, _args = parse_options(sys.argv[1:])
     except getopt.GetoptError as opt_err:
         print(f"Could not read command line: {opt_err}")
         return 1
 
+    # Bind the table lookups once, the loop runs for every option given
+    flag_get = _FLAG_OPTIONS.get
+    value_get = _VALUE_OPTIONS.get
     for opt, arg in opts:
+        flag_opt = flag_get(opt)
+        if flag_opt is not None:
+            setattr(args, flag_opt[0], flag_opt[1])
+            continue
+        value_opt = value_get(opt)
+        if value_opt is not None:
+            setattr(args, value_opt[0], value_opt[1](arg))
+            continue
         if opt in ("-h", "--help"):
             tangoctl = TangoControl(_module_logger, cfg_data)
             tangoctl.usage(os.path.basename(sys.argv[0]))
             sys.exit(1)
-        elif opt == "-a":
-            show_attrib = True
-        elif opt in ("--attribute", "-A"):
-            tgo_attrib = arg
-        elif opt in ("--class", "-d"):
-            disp_action = 5
-        elif opt in ("--cmd", "-c"):
-            show_command = True
-        elif opt in ("--cfg", "-X"):
-            cfg_name = arg
-        elif opt in ("--command", "-C"):
-            tgo_cmd = arg.lower()
-        elif opt in ("--device", "-D"):
-            tgo_name = arg.lower()
-        elif opt in ("--dry-run", "-n"):
-            # TODO Undocumented and unused feature for dry runs
-            dry_run = True
-        elif opt in ("--everything", "-e"):
-            evrythng = True
-        elif opt in ("--full", "-f"):
-            disp_action = 1
-        elif opt in ("--host", "-H"):
-            tango_host = arg
-        elif opt in ("--html", "-w"):
-            fmt = "html"
-        elif opt in ("--input", "-I"):
-            input_file = arg
-        elif opt in ("--json", "-j"):
-            fmt = "json"
-        elif opt in ("--list", "-l"):
-            disp_action = 4
-        elif opt in ("--json-dir", "-J"):
-            json_dir = arg
-        elif opt in ("--md", "-m"):
-            fmt = "md"
-        elif opt in ("--property", "-P"):
-            tgo_prop = arg.lower()
-        elif opt == "--off":
-            dev_off = True
-        elif opt == "--on":
-            dev_on = True
-        elif opt in ("--output", "-O"):
-            output_file = arg
-        elif opt in ("--port", "-p"):
-            tango_port = int(arg)
-        elif opt in ("--quiet", "-q"):
-            quiet_mode = True
-        elif opt in ("--short", "-s"):
-            disp_action = 3
-        elif opt in ("--show-db", "-t"):
-            show_tango = True
-        elif opt == "--simul":
-            dev_sim = int(arg)
-        elif opt == "--standby":
-            dev_standby = True
-        elif opt == "--status":
-            dev_status = True
-        elif opt == "--test":
-            dev_test = True
-        elif opt in ("--tree", "-b"):
-            show_tree = True
-        # TODO Feature to search by input type not implemented yet
-        elif opt in ("--type", "-T"):
-            tgo_in_type = arg.lower()
-            _module_logger.info("Input type %s not implemented", tgo_in_type)
-        elif opt in ("--unique", "-u"):
-            uniq_cls = True
+        elif opt == "--help-topic":
+            tangoctl = TangoControl(_module_logger, cfg_data)
+            tangoctl.usage(os.path.basename(sys.argv[0]), arg)
+            sys.exit(1)
         elif opt == "-v":
             _module_logger.setLevel(logging.INFO)
         elif opt == "-V":
             _module_logger.setLevel(logging.DEBUG)
-        elif opt in ("--value", "-W"):
-            tgo_value = str(arg)
-        elif opt == "--version":
-            show_version = True
-        elif opt in ("--yaml", "-y"):
-            fmt = "yaml"
+        # TODO Feature to search by input type not implemented yet
+        elif opt in ("--type", "-T"):
+            args.tgo_in_type = arg.lower()
+            _module_logger.info("Input type %s not implemented", args.tgo_in_type)
         else:
             _module_logger.error("Invalid option %s", opt)
             return 1
 
-    if show_tree:
+    if args.show_tree:
+        from ska_tangoctl.tango_control.tango_device_tree import device_tree
+
         device_tree()
         return 0
 
-    if cfg_name is not None:
+    if args.cfg_name is not None:
         try:
-            _module_logger.info("Read config file %s", cfg_name)
-            cfg_file: TextIO = open(cfg_name)
-            cfg_data = json.load(cfg_file)
-            cfg_file.close()
+            _module_logger.info("Read config file %s", args.cfg_name)
+            with open(args.cfg_name, "rb") as cfg_file:
+                cfg_data = json_loads(cfg_file.read())
         except FileNotFoundError:
-            _module_logger.error("Could not read config file %s", cfg_name)
+            _module_logger.error("Could not read config file %s", args.cfg_name)
             return 1
 
-    if show_version:
+    if args.show_version:
         print(f"{os.path.basename(sys.argv[0])} version {__version__}")
         return 0
 
-    if show_jargon:
+    if args.show_jargon:
+        from ska_tangoctl.tla_jargon.tla_jargon import print_jargon
+
         print_jargon()
         return 0
 
-    if json_dir:
+    if args.json_dir:
         tangoctl = TangoControl(_module_logger, cfg_data)
-        tangoctl.read_input_files(json_dir, quiet_mode)
+        tangoctl.read_input_files(args.json_dir, args.quiet_mode)
         return 0
 
-    if tango_host is None:
-        tango_host = os.getenv("TANGO_HOST")
-        if tango_host is None:
+    if args.tango_host is None:
+        args.tango_host = os.getenv("TANGO_HOST")
+        if args.tango_host is None:
             print("No Tango database server specified, TANGO_HOST  not set")
             return 1
 
-    _module_logger.info("Use Tango host %s", tango_host)
+    _module_logger.info("Use Tango host %s", args.tango_host)
 
-    os.environ["TANGO_HOST"] = tango_host
-    _module_logger.info("Set TANGO_HOST to %s", tango_host)
+    os.environ["TANGO_HOST"] = args.tango_host
+    _module_logger.info("Set TANGO_HOST to %s", args.tango_host)
 
-    if show_tango:
+    if args.show_tango:
         tangoctl = TangoControl(_module_logger, cfg_data)
-        tangoctl.check_tango(tango_host, quiet_mode, tango_port)
+        tangoctl.check_tango(args.tango_host, args.quiet_mode, args.tango_port)
         return 0
 
-    if input_file is not None:
+    if args.input_file is not None:
         tangoctl = TangoControl(_module_logger, cfg_data)
-        tangoctl.read_input_file(input_file, tgo_name, dry_run)
+        tangoctl.read_input_file(args.input_file, args.tgo_name, args.dry_run)
         return 0
 
-    if dev_off or dev_on or dev_sim or dev_standby or dev_status or show_command or show_attrib:
-        dev_test = True
-    if dev_admin is not None:
-        dev_test = True
-    if dev_test and tgo_name:
-        dut = TestTangoDevice(_module_logger, tgo_name)
+    if (
+        args.dev_off
+        or args.dev_on
+        or args.dev_sim
+        or args.dev_standby
+        or args.dev_status
+        or args.show_command
+        or args.show_attrib
+    ):
+        args.dev_test = True
+    if args.dev_admin is not None:
+        args.dev_test = True
+    if args.dev_test and args.tgo_name:
+        from ska_tangoctl.tango_control.test_tango_device import TestTangoDevice
+
+        dut = TestTangoDevice(_module_logger, args.tgo_name)
         if dut.dev is None:
-            print(f"[FAILED] could not open device {tgo_name}")
+            print(f"[FAILED] could not open device {args.tgo_name}")
             return 1
         rc = dut.run_test(
-            dry_run,
-            dev_admin,
-            dev_off,
-            dev_on,
-            dev_sim,
-            dev_standby,
-            dev_status,
-            show_command,
-            show_attrib,
-            tgo_attrib,
-            tgo_name,
-            tango_port,
+            args.dry_run,
+            args.dev_admin,
+            args.dev_off,
+            args.dev_on,
+            args.dev_sim,
+            args.dev_standby,
+            args.dev_status,
+            args.show_command,
+            args.show_attrib,
+            args.tgo_attrib,
+            args.tgo_name,
+            args.tango_port,
         )
         return rc
 
-    if tgo_name and tgo_attrib and tgo_value:
+    if args.tgo_name and args.tgo_attrib and args.tgo_value:
         tangoctl = TangoControl(_module_logger, cfg_data)
-        rc = tangoctl.set_value(tgo_name, quiet_mode, False, tgo_attrib, tgo_value)
+        rc = tangoctl.set_value(
+            args.tgo_name, args.quiet_mode, False, args.tgo_attrib, args.tgo_value
+        )
         return rc
 
     tangoctl = TangoControl(_module_logger, cfg_data)
     rc = tangoctl.run_info(
-        uniq_cls,
-        output_file,
-        fmt,
-        evrythng,
-        quiet_mode,
+        args.uniq_cls,
+        args.output_file,
+        args.fmt,
+        args.evrythng,
+        args.quiet_mode,
         False,  # reverse sort
-        disp_action,
-        tgo_name,
-        tgo_attrib,
-        tgo_cmd,
-        tgo_prop,
-        tango_port,
+        args.disp_action,
+        args.tgo_name,
+        args.tgo_attrib,
+        args.tgo_cmd,
+        args.tgo_prop,
+        args.tango_port,
     )
     return rc
 
@@ -1,12 +1,17 @@
 """Dance the Tango from a script."""
 
-import json
 import logging
 import os
-from typing import Any, TextIO
+import re
+from typing import Any
 
 import tango
 
+from ska_tangoctl.tango_control.tango_json import json_loads
+
+# Environment variable reference in a script value, e.g. "${ADMIN_MODE}"
+_ENV_VAR: re.Pattern = re.compile(r"\$\{([^}]+)\}")
+
 
 class TangoScript:
     """The classy Tango."""
@@ -34,9 +39,8 @@ class TangoScript:
         self.dev_name: str
         # Read configuration file
         self.logger.warning("Read file %s", input_file)
-        cfg_file: TextIO = open(input_file)
-        self.cfg_data: Any = json.load(cfg_file)
-        cfg_file.close()
+        with open(input_file, "rb") as cfg_file:
+            self.cfg_data: Any = json_loads(cfg_file.read())
         # Get Tango database host
         tango_host = os.getenv("TANGO_HOST")
         if device_name is None:
@@ -96,11 +100,30 @@ class TangoScript:
                                 cmd_args = None
                             self.run_command(cmd_thing, cmd_args)
                     else:
-                        self.logger.info(f"Device {self.dev_name} {thing} ({type(thing)})")
+                        self.logger.info("Device %s %s (%s)", self.dev_name, thing, type(thing))
             else:
-                self.logger.info(f"{test} : {test_cfg}")
+                self.logger.info("%s : %s", test, test_cfg)
         return 0
 
+    def read_env_value(self, value: str) -> str | None:
+        """
+        Replace value with environment variable, if it refers to one.
+
+        :param value: value from script, e.g. "${ADMIN_MODE}"
+        :return: value of environment variable, or value as is
+        """
+        env_match: re.Match | None
+
+        # Most values do not refer to a variable, so skip the regex for those
+        if "${" not in value:
+            return value
+        env_match = _ENV_VAR.search(value)
+        if env_match is None:
+            return value
+        env_value = os.getenv(env_match[1])
+        self.logger.info("Read environment variable %s : %s", env_match[1], env_value)
+        return env_value
+
     def read_write_attribute(  # noqa: C901
         self,
         attr_thing: str | None,
@@ -115,7 +138,6 @@ class TangoScript:
         :param attr_write: write value
         :return: error condition
         """
-        env_name: str
         attrib_data: tango.DeviceAttribute
         attr_type: str
         write_val: Any
@@ -124,21 +146,15 @@ class TangoScript:
             return 1
         if attr_read is not None:
             if type(attr_read) is str:
-                if "${" in attr_read and "}" in attr_read:
-                    env_name = attr_read.split("{")[1].split("}")[0]
-                    attr_read = os.getenv(env_name)
-                    self.logger.info("Read environment variable %s : %s", env_name, attr_read)
-            self.logger.debug("Read attribute %s : should be '%s'", attr_thing, str(attr_read))
+                attr_read = self.read_env_value(attr_read)
+            self.logger.debug("Read attribute %s : should be '%s'", attr_thing, attr_read)
             attrib_data = self.dev.read_attribute(attr_thing)
             print("Attribute %s : %s" % (attrib_data.name, attrib_data.value))
         if attr_write is not None:
             attrib_data = self.dev.read_attribute(attr_thing)
             attr_type = str(attrib_data.type)
             if type(attr_write) is str:
-                if "${" in attr_write and "}" in attr_write:
-                    env_name = attr_write.split("{")[1].split("}")[0]
-                    attr_write = os.getenv(env_name)
-                    self.logger.info("Read environment variable %s : %s", env_name, attr_write)
+                attr_write = self.read_env_value(attr_write)
             self.logger.info("Write attrbute %s value %s", attr_thing, str(attr_write))
             if attr_type == "DevEnum":
                 write_val = int(attr_write)  # type: ignore[arg-type]
@@ -1,19 +1,165 @@
 """Read all information about Tango devices in a Kubernetes cluster."""
 
-import json
 import logging
 import socket
+import sys
 from typing import Any
 
-import tango
-import yaml
-
 try:
     from ska_tangoctl.k8s_info.get_k8s_info import KubernetesControl
 except ModuleNotFoundError:
     KubernetesControl = None  # type: ignore[assignment,misc]
 from ska_tangoctl.tango_control.read_tango_devices import TangoctlDevices
-from ska_tangoctl.tango_control.tango_control import TangoControl
+from ska_tangoctl.tango_control.tango_control import (
+    _USAGE_PARAMS,
+    _USAGE_TEST,
+    BOLD,
+    ITALIC,
+    UNFMT,
+    TangoControl,
+)
+from ska_tangoctl.tango_control.tango_json import json_dumps, json_print, yaml_dumps
+
+# Help text with formatting already applied, the executable name is filled in at run time
+_USAGE_K8S_READ: str = "\n".join(
+    [
+        f"{BOLD}Read Tango devices:{UNFMT}",
+        "\nDisplay version number",
+        "\t{p} --version",
+        "\nDisplay help",
+        "\t{p} --help",
+        "\t{p} -h",
+        "\t{p} --help-topic=<read|test|params|examples>",
+        "\nDisplay Kubernetes namespaces",
+        "\t{p} --show-ns",
+        "\t{p} -k",
+        "\nDisplay Tango database address",
+        "\t{p} --show-db --k8s-ns=<NAMESPACE>",
+        "\t{p} -t -K <NAMESPACE>",
+        f"e.g. {ITALIC}{{p}} -t -K integration{UNFMT}",
+        "\nDisplay classes and Tango devices associated with them",
+        "\t{p} -d|--class --k8s-ns=<NAMESPACE>|--host=<HOST>",
+        "\t{p} -d|--class -K <NAMESPACE>|-H <HOST>",
+        f"e.g. {ITALIC}{{p}} -d -K integration{UNFMT}",
+        "\nList Tango device names",
+        "\t{p} --show-dev --k8s-ns=<NAMESPACE>|--host=<HOST>",
+        "\t{p} -l -K <NAMESPACE>|-H <HOST>",
+        f"e.g. {ITALIC}{{p}} -l -K integration{UNFMT}",
+        "\nDisplay all Tango devices (will take a long time)",
+        "\t{p} --full|--short -e|--everything [--namespace=<NAMESPACE>|--host=<HOST>]",
+        f"\t{{p}} -l -K integration{UNFMT}",
+        f"\te.g. {ITALIC}{{p}} -f|-s -K <NAMESPACE>|-H <HOST>{UNFMT}",
+        "\nFilter on device name",
+        "\t{p} --full|--short -D <DEVICE> -K <NAMESPACE>|-H <HOST>",
+        "\t{p} -f|-s --device=<DEVICE> --k8s-ns=<NAMESPACE>|--host=<HOST>",
+        f"e.g. {ITALIC}{{p}} -f -K integration -D ska_mid/tm_leaf_node/csp_subarray01{UNFMT}",
+        "\nFilter on attribute name",
+        "\t{p} --full|--short --attribute=<ATTRIBUTE> --k8s-ns=<NAMESPACE>|--host=<HOST>",
+        "\t{p} -f|-s -A <ATTRIBUTE> -K <NAMESPACE>|-H <HOST>",
+        f"e.g. {ITALIC}{{p}} -f -K integration -A timeout{UNFMT}",
+        "\nFilter on command name",
+        "\t{p} --full|--short --command=<COMMAND> --k8s-ns=<NAMESPACE>|--host=<HOST>",
+        "\t{p} -f|-s -C <COMMAND> -K <NAMESPACE>|-H <HOST>",
+        f"e.g. {ITALIC}{{p}} -l -K integration -C status{UNFMT}",
+        "\nFilter on property name",
+        "\t{p} --full|--list|--short --property=<PROPERTY> --k8s-ns=<NAMESPACE>|--host=<HOST>",
+        "\t{p} -f|-s -P <PROPERTY> --k8s-ns=<NAMESPACE>|--host=<HOST>",
+        f"e.g. {ITALIC}{{p}} -l -K integration -P power{UNFMT}",
+        "\nDisplay {p} test input files",
+        "\t{p} --json-dir=<PATH>",
+        "\t{p} -J <PATH>",
+        f"e.g. {ITALIC}ADMIN_MODE=1 {{p}} -J resources/{UNFMT}",
+        "\nRun test, reading from input file",
+        "\t{p} --k8s-ns=<NAMESPACE> --input=<FILE>",
+        "\t{p} --K <NAMESPACE> -O <FILE>",
+        "Files are in JSON format and contain values to be read and/or written, e.g:",
+        f"{ITALIC}{{",
+        '    "description": "Turn admin mode on and check status",',
+        '    "test_on": [',
+        "        {",
+        '            "attribute": "adminMode",',
+        '            "read" : ""',
+        "        },",
+        "        {",
+        '            "attribute": "adminMode",',
+        '            "write": 1',
+        "        },",
+        "        {",
+        '            "attribute": "adminMode",',
+        '            "read": 1',
+        "        },",
+        "        {",
+        '            "command": "State",',
+        '            "return": "OFFLINE"',
+        "        },",
+        "        {",
+        '            "command": "Status"',
+        "        }",
+        "    ]",
+        f"}}{UNFMT}",
+        "\nFiles can contain environment variables that are read at run-time:",
+        f"{ITALIC}{{",
+        '    "description": "Turn admin mode off and check status",',
+        '    "test_on": [',
+        "        {",
+        '            "attribute": "adminMode",',
+        '            "read": ""',
+        "        },",
+        "        {",
+        '            "attribute": "adminMode",',
+        '            "write": "${ADMIN_MODE}"',
+        "        },",
+        "        {",
+        '            "attribute": "adminMode",',
+        '            "read": "${ADMIN_MODE}"',
+        "        },",
+        "        {",
+        '            "command": "State",',
+        '            "return": "ONLINE"',
+        "        },",
+        "        {",
+        '            "command": "Status"',
+        "        }",
+        "    ]",
+        f"}}{UNFMT}",
+        "\nTo run the above:",
+        f"{ITALIC}ADMIN_MODE=1 {{p}} --integration"
+        f" -D mid_csp_cbf/talon_board/001 -f --in resources/dev_online.json -V{UNFMT}",
+        "",
+    ]
+)
+
+# Tests and parameters are as for tangoctl, with the namespace options added
+_USAGE_K8S_TEST: str = _USAGE_TEST.replace("[-H <HOST>]", " -K <NAMESPACE>|-H <HOST>")
+
+_USAGE_K8S_PARAMS: str = _USAGE_PARAMS.replace(
+    "\t-f|--full\t\t\tdisplay in full\n",
+    "\t-f|--full\t\t\tdisplay in full\n\t-i|--ip\t\t\tuse IP address instead of FQDN\n",
+).replace(
+    "\t-D <DEVICE>\n",
+    "\t-D <DEVICE>\n"
+    "\t--k8s-ns=<NAMESPACE>\t\tKubernetes namespace for Tango database, e.g. 'integration'\n"
+    "\t-K <NAMESPACE>\n",
+)
+
+_USAGE_K8S_EXAMPLES: str = "\n".join(
+    [
+        f"\n{BOLD}Examples:{UNFMT}",
+        "\n\t{p} --integration -l",
+        "\t{p} --integration -D talon -l",
+        "\t{p} --integration -A timeout",
+        "\t{p} --integration -C Telescope",
+        "\t{p} --integration -P Power",
+        "\t{p} --integration -D mid_csp_cbf/talon_lru/001 -f",
+        "\t{p} --integration -D mid_csp_cbf/talon_lru/001 -q",
+        "\t{p} --integration -D mid_csp_cbf/talon_board/001 -f",
+        "\t{p} --integration -D mid_csp_cbf/talon_board/001 -f --dry",
+        "\t{p} --integration -D mid-sdp/control/0 --on",
+        "\tADMIN_MODE=1 {p} --integration"
+        " -D mid_csp_cbf/talon_board/001 -f --in resources/dev_online.json -V",
+        "\n",
+    ]
+)
 
 
 def get_namespaces_list(logger: logging.Logger, kube_namespace: str | None) -> list:
@@ -85,17 +231,17 @@ def show_namespaces(
         if output_file is not None:
             logger.info("Write output file %s", output_file)
             with open(output_file, "a") as outf:
-                outf.write(json.dumps(ns_dict, indent=4))
+                outf.write(json_dumps(ns_dict))
         else:
-            print(json.dumps(ns_dict, indent=4))
+            json_print(ns_dict)
     elif fmt == "yaml":
         ns_dict = get_namespaces_dict(logger)
         if output_file is not None:
             logger.info("Write output file %s", output_file)
             with open(output_file, "a") as outf:
-                outf.write(yaml.dump(ns_dict))
+                outf.write(yaml_dumps(ns_dict))
         else:
-            print(yaml.dump(ns_dict))
+            print(yaml_dumps(ns_dict))
     else:
         ns_list = get_namespaces_list(logger, kube_namespace)
         print(f"Namespaces : {len(ns_list)}")
@@ -106,6 +252,8 @@ def show_namespaces(
 class TangoControlKubernetes(TangoControl):
     """Read Tango devices running in a Kubernetes cluster."""
 
+    __slots__ = ()
+
     def __init__(self, logger: logging.Logger, cfg_data: Any, ns_name: str | None):
         """
         Time to rock and roll.
@@ -117,248 +265,42 @@ class TangoControlKubernetes(TangoControl):
         super().__init__(logger, cfg_data, ns_name)
         self.cfg_data: Any = cfg_data
 
-    def usage(self, p_name: str) -> None:
+    def usage(self, p_name: str, topic: str | None = None) -> None:
         """
         Show how it is done.
 
         :param p_name: executable name
+        :param topic: only show this part, one of USAGE_TOPICS
         """
         if KubernetesControl is None:
-            super().usage(p_name)
+            super().usage(p_name, topic)
+            return
+        if not self.usage_topic_ok(topic):
             return
 
-        print("\033[1mRead Tango devices:\033[0m")
-        print("\nDisplay version number")
-        print(f"\t{p_name} --version")
-        print("\nDisplay help")
-        print(f"\t{p_name} --help")
-        print(f"\t{p_name} -h")
-        print("\nDisplay Kubernetes namespaces")
-        print(f"\t{p_name} --show-ns")
-        print(f"\t{p_name} -k")
-        # Tango database address for a namespace
-        print("\nDisplay Tango database address")
-        print(f"\t{p_name} --show-db --k8s-ns=<NAMESPACE>")
-        print(f"\t{p_name} -t -K <NAMESPACE>")
-        print(f"e.g. \033[3m{p_name} -t -K integration\033[0m")
-        # Display class names
-        print("\nDisplay classes and Tango devices associated with them")
-        print(f"\t{p_name} -d|--class --k8s-ns=<NAMESPACE>|--host=<HOST>")
-        print(f"\t{p_name} -d|--class -K <NAMESPACE>|-H <HOST>")
-        print(f"e.g. \033[3m{p_name} -d -K integration\033[0m")
-        # List device names
-        print("\nList Tango device names")
-        print(f"\t{p_name} --show-dev --k8s-ns=<NAMESPACE>|--host=<HOST>")
-        print(f"\t{p_name} -l -K <NAMESPACE>|-H <HOST>")
-        print(f"e.g. \033[3m{p_name} -l -K integration\033[0m")
-        print("\nDisplay all Tango devices (will take a long time)")
-        print(f"\t{p_name} --full|--short -e|--everything [--namespace=<NAMESPACE>|--host=<HOST>]")
-        print(f"\t{p_name} -l -K integration\033[0m")
-        print(f"\te.g. \033[3m{p_name} -f|-s -K <NAMESPACE>|-H <HOST>\033[0m")
-        # Display devices
-        print("\nFilter on device name")
-        print(f"\t{p_name} --full|--short -D <DEVICE> -K <NAMESPACE>|-H <HOST>")
-        print(f"\t{p_name} -f|-s --device=<DEVICE> --k8s-ns=<NAMESPACE>|--host=<HOST>")
-        print(
-            f"e.g. \033[3m{p_name} -f -K integration -D ska_mid/tm_leaf_node/csp_subarray01\033[0m"
-        )
-        # Display attributes
-        print("\nFilter on attribute name")
-        print(
-            f"\t{p_name} --full|--short --attribute=<ATTRIBUTE> --k8s-ns=<NAMESPACE>|--host=<HOST>"
-        )
-        print(f"\t{p_name} -f|-s -A <ATTRIBUTE> -K <NAMESPACE>|-H <HOST>")
-        print(f"e.g. \033[3m{p_name} -f -K integration -A timeout\033[0m")
-        # Display commands
-        print("\nFilter on command name")
-        print(f"\t{p_name} --full|--short --command=<COMMAND> --k8s-ns=<NAMESPACE>|--host=<HOST>")
-        print(f"\t{p_name} -f|-s -C <COMMAND> -K <NAMESPACE>|-H <HOST>")
-        print(f"e.g. \033[3m{p_name} -l -K integration -C status\033[0m")
-        # Display properties
-        print("\nFilter on property name")
-        print(
-            f"\t{p_name} --full|--list|--short --property=<PROPERTY>"
-            " --k8s-ns=<NAMESPACE>|--host=<HOST>"
-        )
-        print(f"\t{p_name} -f|-s -P <PROPERTY> --k8s-ns=<NAMESPACE>|--host=<HOST>")
-        print(f"e.g. \033[3m{p_name} -l -K integration -P power\033[0m")
-        # TODO make this work
-        # print("\nDisplay known acronyms")
-        # print(f"\t{p_name} -j")
-        # _______________________
-        # Testing with input file
-        print(f"\nDisplay {p_name} test input files")
-        print(f"\t{p_name} --json-dir=<PATH>")
-        print(f"\t{p_name} -J <PATH>")
-        print(f"e.g. \033[3mADMIN_MODE=1 {p_name} -J resources/\033[0m")
-        print("\nRun test, reading from input file")
-        print(f"\t{p_name} --k8s-ns=<NAMESPACE> --input=<FILE>")
-        print(f"\t{p_name} --K <NAMESPACE> -O <FILE>")
-        print("Files are in JSON format and contain values to be read and/or written, e.g:")
-        print(
-            """\033[3m{
-    "description": "Turn admin mode on and check status",
-    "test_on": [
-        {
-            "attribute": "adminMode",
-            "read" : ""
-        },
-        {
-            "attribute": "adminMode",
-            "write": 1
-        },
-        {
-            "attribute": "adminMode",
-            "read": 1
-        },
-        {
-            "command": "State",
-            "return": "OFFLINE"
-        },
-        {
-            "command": "Status"
-        }
-    ]
-}\033[0m
-"""
-        )
-        print("Files can contain environment variables that are read at run-time:")
-        print(
-            """\033[3m{
-    "description": "Turn admin mode off and check status",
-    "test_on": [
-        {
-            "attribute": "adminMode",
-            "read": ""
-        },
-        {
-            "attribute": "adminMode",
-            "write": "${ADMIN_MODE}"
-        },
-        {
-            "attribute": "adminMode",
-            "read": "${ADMIN_MODE}"
-        },
-        {
-            "command": "State",
-            "return": "ONLINE"
-        },
-        {
-            "command": "Status"
-        }
-    ]
-}\033[0m
-"""
-        )
-        print("To run the above:")
-        print(
-            f"\033[3mADMIN_MODE=1 {p_name}"
-            " --integration"
-            " -D mid_csp_cbf/talon_board/001 -f --in resources/dev_online.json -V\033[0m"
-        )
-        # _______
-        # Testing
-        print("\n\033[1mTest Tango devices:\033[0m")
-        print("\nTest a Tango device")
-        print(f"\t{p_name} -K <NAMESPACE>|-H <HOST> -D <DEVICE> [--simul=<0|1>]")
-        print("\nTest a Tango device and read attributes")
-        print(f"\t{p_name} -a -K <NAMESPACE>|-H <HOST> -D <DEVICE> [--simul=<0|1>]")
-        print("\nDisplay attribute and command names for a Tango device")
-        print(f"\t{p_name} -c -K <NAMESPACE>|-H <HOST> -D <DEVICE>")
-        print("\nTurn a Tango device on")
-        print(f"\t{p_name} --on -K <NAMESPACE>|-H <HOST> -D <DEVICE> [--simul=<0|1>]")
-        print("\nTurn a Tango device off")
-        print(f"\t{p_name} --off -K <NAMESPACE>|-H <HOST> -D <DEVICE> [--simul=<0|1>]")
-        print("\nSet a Tango device to standby mode")
-        print(f"\t{p_name} --standby -K <NAMESPACE>|-H <HOST> -D <DEVICE> [--simul=<0|1>]")
-        print("\nChange admin mode on a Tango device")
-        print(f"\t{p_name} --admin=<0|1>")
-        print("\nDisplay status of a Tango device")
-        print(f"\t{p_name} --status -K <NAMESPACE>|-H <HOST> -D <DEVICE>")
-        print("\nCheck events for attribute of a Tango device")
-        print(f"\t{p_name} -K <NAMESPACE>|-H <HOST> -D <DEVICE> -A <ATTRIBUTE>")
-        # ______________________
-        # Options and parameters
-        print("\n\033[1mParameters:\033[0m\n")
-        print("\t-a\t\t\t\tflag for reading attributes during tests")
-        print("\t-c|--cmd\t\t\tflag for running commands during tests")
-        print("\t--simul=<0|1>\t\t\tset simulation mode off or on")
-        print("\t--admin=<0|1>\t\t\tset admin mode off or on")
-        print("\t-e|--everything\t\t\tshow all devices")
-        print("\t-f|--full\t\t\tdisplay in full")
-        print("\t-i|--ip\t\t\tuse IP address instead of FQDN")
-        print("\t-l|--list\t\t\tdisplay device name and status on one line")
-        print("\t-s|--short\t\t\tdisplay device name, status and query devices")
-        print("\t-q|--quiet\t\t\tdo not display progress bars")
-        print("\t-w|--html\t\t\toutput in HTML format")
-        print("\t-j|--json\t\t\toutput in JSON format")
-        print("\t-m|--md\t\t\t\toutput in markdown format")
-        print("\t-y|--yaml\t\t\toutput in YAML format")
-        print("\t-u|--unique\t\t\tonly read one device for each class")
-        print("\t--cfg=<FILE>\t\toverride configuration from file")
-        print("\t-X <FILE>")
-        print("\t--json-dir=<PATH>\t\tdirectory with JSON input file, e.g. 'resources'")
-        print("\t-J <PATH>")
-        print(
-            "\t--device=<DEVICE>\t\tdevice name, e.g. 'csp'"
-            " (not case sensitive, only a part is needed)"
-        )
-        print("\t-D <DEVICE>")
-        print(
-            "\t--k8s-ns=<NAMESPACE>\t\tKubernetes namespace for Tango database,"
-            " e.g. 'integration'"
-        )
-        print("\t-K <NAMESPACE>")
-        print("\t--host=<HOST>\t\t\tTango database host and port, e.g. 10.8.13.15:10000")
-        print("\t-H <HOST>")
-        print("\t--attribute=<ATTRIBUTE>\t\tattribute name, e.g. 'obsState' (not case sensitive)")
-        print("\t-A <ATTRIBUTE>")
-        print("\t--command=<COMMAND>\t\tcommand name, e.g. 'Status' (not case sensitive)")
-        print("\t-C <COMMAND>")
-        print("\t--output=<FILE>\t\t\toutput file name")
-        print("\t-O <FILE>")
-        print("\t--input=<FILE>\t\t\tinput file name")
-        print("\t-I <FILE>")
-        print(
-            "\nNote that values for device, attribute, command or property are not case sensitive."
-        )
-        print(
-            f"Partial matches for strings longer than {self.cfg_data['min_str_len']}"
-            " charaters are OK."
-        )
-        print(
-            "\nWhen a namespace is specified, the Tango database host will be made up as follows:"
-        )
-        print(
-            f"\t{self.cfg_data['databaseds_name']}.<NAMESPACE>.{self.cfg_data['cluster_domain']}"
-            f":{self.cfg_data['databaseds_port']}"
-        )
-        print(
-            "\nRun the following commands where applicable:"
-            f"\n\t{','.join(self.cfg_data['run_commands'])}"
-        )
-        print(
-            f"\nRun commands with device name as parameter where applicable:\n"
-            f"\t{','.join(self.cfg_data['run_commands_name'])}"
-        )
-        # __________________
-        # Some more examples
-        print("\n\033[1mExamples:\033[0m\n")
-        print(f"\t{p_name} --integration -l")
-        print(f"\t{p_name} --integration -D talon -l")
-        print(f"\t{p_name} --integration -A timeout")
-        print(f"\t{p_name} --integration -C Telescope")
-        print(f"\t{p_name} --integration -P Power")
-        print(f"\t{p_name} --integration -D mid_csp_cbf/talon_lru/001 -f")
-        print(f"\t{p_name} --integration -D mid_csp_cbf/talon_lru/001 -q")
-        print(f"\t{p_name} --integration -D mid_csp_cbf/talon_board/001 -f")
-        print(f"\t{p_name} --integration -D mid_csp_cbf/talon_board/001 -f --dry")
-        print(f"\t{p_name} --integration -D mid-sdp/control/0 --on")
-        print(
-            f"\tADMIN_MODE=1 {p_name} --integration"
-            f" -D mid_csp_cbf/talon_board/001 -f --in resources/dev_online.json -V"
-        )
-        print()
+        parts: list[str] = []
+        if topic in (None, "read"):
+            parts.append(_USAGE_K8S_READ.replace("{p}", p_name))
+        if topic in (None, "test"):
+            parts.append(_USAGE_K8S_TEST.replace("{p}", p_name))
+        if topic in (None, "params"):
+            parts.append(_USAGE_K8S_PARAMS.replace("{p}", p_name))
+            parts.append(
+                f"Partial matches for strings longer than {self.cfg_data['min_str_len']}"
+                " charaters are OK.\n"
+                "\nWhen a namespace is specified, the Tango database host will be made up"
+                " as follows:"
+                f"\n\t{self.cfg_data['databaseds_name']}.<NAMESPACE>"
+                f".{self.cfg_data['cluster_domain']}:{self.cfg_data['databaseds_port']}\n"
+                "\nRun the following commands where applicable:"
+                f"\n\t{','.join(self.cfg_data['run_commands'])}\n"
+                "\nRun commands with device name as parameter where applicable:"
+                f"\n\t{','.join(self.cfg_data['run_commands_name'])}\n"
+            )
+        if topic in (None, "examples"):
+            parts.append(_USAGE_K8S_EXAMPLES.replace("{p}", p_name))
+        # One write for the whole text
+        sys.stdout.write("".join(parts))
 
     def check_tango(
         self,
@@ -374,14 +316,15 @@ class TangoControlKubernetes(TangoControl):
         :param tango_port: port number
         :return: error condition
         """
-        tango_addr: tuple[str, list[str], list[str]]
         tango_ip: str
+
+        from ska_tangoctl.tango_control.check_tango_device import get_host_ip
+
         self.logger.info("Check Tango host %s:%d", tango_fqdn, tango_port)
         try:
-            tango_addr = socket.gethostbyname_ex(tango_fqdn)
-            tango_ip = tango_addr[2][0]
+            tango_ip = get_host_ip(tango_fqdn)
         except socket.gaierror as e:
-            self.logger.error("Could not read address %s : %s" % (tango_fqdn, e))
+            self.logger.error("Could not read address %s : %s", tango_fqdn, e)
             return 1
         if not quiet_mode:
             print(f"TANGO_HOST={tango_fqdn}:{tango_port}")
@@ -516,17 +459,17 @@ class TangoControlKubernetes(TangoControl):
             if output_file is not None:
                 self.logger.info("Write output file %s", output_file)
                 with open(output_file, "a") as outf:
-                    outf.write(json.dumps(pods, indent=4))
+                    outf.write(json_dumps(pods))
             else:
-                print(json.dumps(pods, indent=4))
+                json_print(pods)
         elif fmt == "yaml":
             pods = self.get_pods_json(ns_name, quiet_mode)
             if output_file is not None:
                 self.logger.info("Write output file %s", output_file)
                 with open(output_file, "a") as outf:
-                    outf.write(yaml.dump(pods))
+                    outf.write(yaml_dumps(pods))
             else:
-                print(yaml.dump(pods))
+                print(yaml_dumps(pods))
         elif fmt == "txt":
             self.print_pods(ns_name, quiet_mode)
         else:
@@ -567,7 +510,7 @@ class TangoControlKubernetes(TangoControl):
         :return: error condition
         """
         rc: int
-        devices: TangoctlDevices
+        devices: TangoctlDevices | None
         self.logger.info(
             "Info display action %d : device %s attribute %s command %s property %s",
             disp_action,
@@ -577,8 +520,17 @@ class TangoControlKubernetes(TangoControl):
             tgo_prop,
         )
 
+        no_filter: bool = tgo_attrib is None and tgo_cmd is None and tgo_prop is None
+
+        if tgo_name is None and no_filter and disp_action == 0 and evrythng is False:
+            self.logger.error(
+                "No filters specified, use '-l' flag to list all devices"
+                " or '-e' for a full display of every device in the namespace",
+            )
+            return 1
+
         # List Tango devices
-        if disp_action == 4 and tgo_attrib is None and tgo_cmd is None and tgo_prop is None:
+        if disp_action == 4 and no_filter:
             rc = self.list_devices(
                 file_name,
                 fmt,
@@ -595,59 +547,38 @@ class TangoControlKubernetes(TangoControl):
             rc = self.list_classes(fmt, evrythng, quiet_mode, reverse, tgo_name)
             return rc
 
-        if (
-            tgo_name is None
-            and tgo_attrib is None
-            and tgo_cmd is None
-            and tgo_prop is None
-            and (not disp_action)
-            and (not evrythng)
-        ):
-            self.logger.error(
-                "No filters specified, use '-l' flag to list all devices"
-                " or '-e' for a full display of every device in the namespace",
-            )
+        devices = self._make_devices(
+            uniq_cls,
+            quiet_mode,
+            reverse,
+            evrythng,
+            tgo_name,
+            tgo_attrib,
+            tgo_cmd,
+            tgo_prop,
+            file_name,
+            fmt,
+            "K8S info",
+        )
+        if devices is None:
             return 1
 
-        try:
-            devices = TangoctlDevices(
-                self.logger,
-                uniq_cls,
-                quiet_mode,
-                reverse,
-                evrythng,
-                self.cfg_data,
-                tgo_name,
-                tgo_attrib,
-                tgo_cmd,
-                tgo_prop,
-                file_name,
-                fmt,
-            )
-        except tango.ConnectionFailed:
-            self.logger.error("Tango connection for K8S info failed")
-            return 1
-        devices.read_device_values()
+        # Listing attribute, command or property names only needs the device configs
+        names_only = fmt == "txt" and disp_action == 4 and not no_filter
+        if not names_only:
+            devices.read_device_values()
 
         self.logger.debug("Read devices (action %d)", disp_action)
 
-        if fmt == "txt" and disp_action == 4 and tgo_attrib is not None:
+        if names_only and tgo_attrib is not None:
             devices.print_txt_list_attributes()
-        elif fmt == "txt" and disp_action == 4 and tgo_cmd is not None:
+        elif names_only and tgo_cmd is not None:
             devices.print_txt_list_commands()
-        elif fmt == "txt" and disp_action == 4 and tgo_prop is not None:
+        elif names_only:
             devices.print_txt_list_properties()
         elif fmt == "txt":
             devices.print_txt(disp_action, f"{self.ns_name}" if self.ns_name else None)
-        elif fmt == "html":
-            devices.print_html(disp_action)
-        elif fmt == "json":
-            devices.print_json(disp_action)
-        elif fmt == "md":
-            devices.print_markdown(disp_action)
-        elif fmt == "yaml":
-            devices.print_yaml(disp_action)
         else:
-            print("---")
+            self.print_devices(devices, fmt, disp_action)
 
         return 0
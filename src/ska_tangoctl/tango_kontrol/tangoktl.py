@@ -5,7 +5,7 @@ import getopt
 import logging
 import os
 import sys
-from typing import Any
+from typing import Any, Callable, Final
 
 import tango
 
@@ -13,6 +13,9 @@ from ska_tangoctl import __version__
 from ska_tangoctl.tango_control.read_tango_devices import TangoctlDevices
 from ska_tangoctl.tango_control.tango_database import TangoHostInfo, get_tango_hosts
 from ska_tangoctl.tango_control.tango_device_tree import device_tree
+from ska_tangoctl.tango_control.tangoctl import _FLAG_OPTIONS as _CTL_FLAG_OPTIONS
+from ska_tangoctl.tango_control.tangoctl import _VALUE_OPTIONS as _CTL_VALUE_OPTIONS
+from ska_tangoctl.tango_control.tangoctl import TangoctlOptions
 from ska_tangoctl.tango_control.test_tango_device import TestTangoDevice
 from ska_tangoctl.tango_kontrol.tango_kontrol import TangoControlKubernetes, show_namespaces
 from ska_tangoctl.tango_kontrol.tangoktl_config import read_tangoktl_config
@@ -150,249 +153,200 @@ def read_tango_attributes(cfg_data: Any) -> int:
     return rc
 
 
+class TangoktlOptions(TangoctlOptions):
+    """Settings read from the command line, with the Kubernetes settings added."""
+
+    __slots__ = ("kube_namespace", "reverse", "show_ns", "show_pod", "use_fqdn")
+
+    def __init__(self) -> None:
+        """Set default values."""
+        super().__init__()
+        # TODO Feature to dispaly a pod, not implemented yet
+        # self.kube_pod: str | None = None
+        self.kube_namespace: str | None = None
+        self.reverse: bool = False
+        self.show_ns: bool = False
+        self.show_pod: bool = False
+        self.use_fqdn: bool = True
+
+
+# Options recognised on the command line, in the format expected by getopt
+_SHORT_OPTS: Final[str] = "abcdefhijklmnoqrstuvwxyVA:C:H:D:I:J:K:p:O:P:Q:X:T:W:X:"
+_LONG_OPTS: Final[tuple[str, ...]] = (
+    "class",
+    "cmd",
+    "dry-run",
+    "everything",
+    "full",
+    "help",
+    "html",
+    "ip",
+    "json",
+    "list",
+    "md",
+    "off",
+    "on",
+    "quiet",
+    "reverse",
+    "standby",
+    "status",
+    "short",
+    "show-acronym",
+    "show-db",
+    "show-dev",
+    "show-ns",
+    "show-pod",
+    "tree",
+    "unique",
+    "version",
+    "yaml",
+    "admin=",
+    "attribute=",
+    "cfg=",
+    "command=",
+    "device=",
+    "help-topic=",
+    "host=",
+    "input=",
+    "json-dir=",
+    "k8s-ns=",
+    "k8s-pod=",
+    "output=",
+    "port=",
+    "property=",
+    "simul=",
+    "type=",
+    "value=",
+)
+
+# Command line flags, as for tangoctl with the Kubernetes flags added
+_FLAG_OPTIONS: dict[str, tuple[str, Any]] = {
+    **_CTL_FLAG_OPTIONS,
+    "--ip": ("use_fqdn", False),
+    "-i": ("use_fqdn", False),
+    "--reverse": ("reverse", True),
+    "-r": ("reverse", True),
+    "--show-ns": ("show_ns", True),
+    "-k": ("show_ns", True),
+    "--show-pod": ("show_pod", True),
+    "-x": ("show_pod", True),
+}
+
+# Command line options with a value, as for tangoctl with the namespace added
+_VALUE_OPTIONS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    **_CTL_VALUE_OPTIONS,
+    "--k8s-ns": ("kube_namespace", str),
+    "-K": ("kube_namespace", str),
+    # TODO make this work
+    # "--k8s-pod": ("kube_pod", str),
+    # "-Q": ("kube_pod", str),
+}
+
+
 def main() -> int:  # noqa: C901
     """
     Read and display Tango devices.
 
     :return: error condition
     """
-    # TODO Feature to dispaly a pod, not implemented yet
-    # kube_pod: str | None = None
-    disp_action: int = 0
-    dev_admin: int | None = None
-    dev_off: bool = False
-    dev_on: bool = False
-    dev_sim: int | None = None
-    dev_standby: bool = False
-    dev_status: bool = False
-    dry_run: bool = False
-    evrythng: bool = False
-    fmt: str = "txt"
-    input_file: str | None = None
-    json_dir: str | None = None
-    kube_namespace: str | None = None
-    output_file: str | None = None
-    quiet_mode: bool = False
+    args: TangoktlOptions = TangoktlOptions()
     rc: int
-    show_attrib: bool = False
-    show_command: bool = False
-    show_jargon: bool = False
-    show_ns: bool = False
-    show_pod: bool = False
-    show_tango: bool = False
-    show_tree: bool = False
-    show_version: bool = False
-    reverse: bool = False
-    tango_host: str | None = None
-    tango_port: int = 10000
-    tgo_attrib: str | None = None
-    tgo_cmd: str | None = None
     tangoktl: TangoControlKubernetes
-    # TODO Feature to search by input type, not implemented yet
-    tgo_in_type: str | None = None
-    tgo_name: str | None = None
-    tgo_prop: str | None = None
-    tgo_value: str | None = None
-    uniq_cls: bool = False
-    use_fqdn: bool = True
+    flag_opt: tuple[str, Any] | None
+    value_opt: tuple[str, Callable[[str], Any]] | None
 
     # Read configuration
     cfg_data: Any = read_tangoktl_config(_module_logger)
-    cfg_name: str | None = None
 
     databaseds_name: str = cfg_data["databaseds_name"]
     cluster_domain: str = cfg_data["cluster_domain"]
     databaseds_port: int = cfg_data["databaseds_port"]
 
+    # Answer requests for help without reading the rest of the command line,
+    # only the first argument is checked since later ones could be option values
+    if sys.argv[1:2] in (["-h"], ["--help"]):
+        tangoktl = TangoControlKubernetes(_module_logger, cfg_data, None)
+        tangoktl.usage(os.path.basename(sys.argv[0]))
+        sys.exit(1)
+
     try:
-        opts, _args = getopt.getopt(
-            sys.argv[1:],
-            "abcdefhijklmnoqrstuvwxyVA:C:H:D:I:J:K:p:O:P:Q:X:T:W:X:",
-            [
-                "class",
-                "cmd",
-                "dry-run",
-                "everything",
-                "full",
-                "help",
-                "html",
-                "ip",
-                "json",
-                "list",
-                "md",
-                "off",
-                "on",
-                "quiet",
-                "reverse",
-                "standby",
-                "status",
-                "short",
-                "show-acronym",
-                "show-db",
-                "show-dev",
-                "show-ns",
-                "show-pod",
-                "tree",
-                "unique",
-                "version",
-                "yaml",
-                "admin=",
-                "attribute=",
-                "cfg=",
-                "command=",
-                "device=",
-                "host=",
-                "input=",
-                "json-dir=",
-                "k8s-ns=",
-                "k8s-pod=",
-                "output=",
-                "port=",
-                "property=",
-                "simul=",
-                "type=",
-                "value=",
-            ],
-        )
+        opts, _args = getopt.getopt(sys.argv[1:], _SHORT_OPTS, _LONG_OPTS)
     except getopt.GetoptError as opt_err:
         print(f"Could not read command line: {opt_err}")
         return 1
 
+    # Bind the table lookups once, the loop runs for every option given
+    flag_get = _FLAG_OPTIONS.get
+    value_get = _VALUE_OPTIONS.get
     for opt, arg in opts:
+        flag_opt = flag_get(opt)
+        if flag_opt is not None:
+            setattr(args, flag_opt[0], flag_opt[1])
+            continue
+        value_opt = value_get(opt)
+        if value_opt is not None:
+            setattr(args, value_opt[0], value_opt[1](arg))
+            continue
         if opt in ("-h", "--help"):
             tangoktl = TangoControlKubernetes(_module_logger, cfg_data, None)
             tangoktl.usage(os.path.basename(sys.argv[0]))
             sys.exit(1)
-        elif opt == "-a":
-            show_attrib = True
-        elif opt in ("--attribute", "-A"):
-            tgo_attrib = arg
-        elif opt in ("--class", "-d"):
-            disp_action = 5
-        elif opt in ("--cfg", "-X"):
-            cfg_name = arg
-        elif opt in ("--cmd", "-c"):
-            show_command = True
-        elif opt in ("--command", "-C"):
-            tgo_cmd = arg.lower()
-        elif opt in ("--device", "-D"):
-            tgo_name = arg.lower()
-        elif opt in ("--dry-run", "-n"):
-            # TODO Undocumented and unused feature for dry runs
-            dry_run = True
-        elif opt in ("--everything", "-e"):
-            evrythng = True
-        elif opt in ("--full", "-f"):
-            disp_action = 1
-        elif opt in ("--host", "-H"):
-            tango_host = arg
-        elif opt in ("--html", "-w"):
-            fmt = "html"
-        elif opt in ("--input", "-I"):
-            input_file = arg
-        elif opt in ("--ip", "-i"):
-            use_fqdn = False
-        elif opt in ("--json", "-j"):
-            fmt = "json"
-        elif opt in ("--list", "-l"):
-            disp_action = 4
-        elif opt in ("--json-dir", "-J"):
-            json_dir = arg
-        elif opt in ("--md", "-m"):
-            fmt = "md"
-        elif opt in ("--k8s-ns", "-K"):
-            kube_namespace = arg
-        # TODO make this work
-        # elif opt in ("--k8s-pod", "-Q"):
-        #     kube_pod = arg
-        elif opt in ("--property", "-P"):
-            tgo_prop = arg.lower()
-        elif opt == "--off":
-            dev_off = True
-        elif opt == "--on":
-            dev_on = True
-        elif opt in ("--output", "-O"):
-            output_file = arg
-        elif opt in ("--port", "-p"):
-            tango_port = int(arg)
-        elif opt in ("--quiet", "-q"):
-            quiet_mode = True
-        elif opt in ("--reverse", "-r"):
-            reverse = True
-        elif opt in ("--short", "-s"):
-            disp_action = 3
-        elif opt in ("--show-db", "-t"):
-            show_tango = True
-        elif opt in ("--show-ns", "-k"):
-            show_ns = True
-        elif opt in ("--show-pod", "-x"):
-            show_pod = True
-        elif opt == "--simul":
-            dev_sim = int(arg)
-        elif opt == "--standby":
-            dev_standby = True
-        elif opt == "--status":
-            dev_status = True
-        elif opt in ("--tree", "-b"):
-            show_tree = True
-        # TODO Feature to search by input type not implemented yet
-        elif opt in ("--type", "-T"):
-            tgo_in_type = arg.lower()
-            _module_logger.info("Input type %s not implemented", tgo_in_type)
-        elif opt in ("--unique", "-u"):
-            uniq_cls = True
+        elif opt == "--help-topic":
+            tangoktl = TangoControlKubernetes(_module_logger, cfg_data, None)
+            tangoktl.usage(os.path.basename(sys.argv[0]), arg)
+            sys.exit(1)
         elif opt == "-v":
             _module_logger.setLevel(logging.INFO)
         elif opt == "-V":
             _module_logger.setLevel(logging.DEBUG)
-        elif opt in ("--value", "-W"):
-            tgo_value = str(arg)
-        elif opt == "--version":
-            show_version = True
-        elif opt in ("--yaml", "-y"):
-            fmt = "yaml"
+        # TODO Feature to search by input type not implemented yet
+        elif opt in ("--type", "-T"):
+            args.tgo_in_type = arg.lower()
+            _module_logger.info("Input type %s not implemented", args.tgo_in_type)
         else:
             _module_logger.error("Invalid option %s", opt)
             return 1
 
-    if show_version:
+    if args.show_version:
         print(f"{os.path.basename(sys.argv[0])} version {__version__}")
         return 0
 
-    if cfg_name is not None:
-        cfg_data = read_tangoktl_config(_module_logger, cfg_name)
+    if args.cfg_name is not None:
+        cfg_data = read_tangoktl_config(_module_logger, args.cfg_name)
 
-    if show_jargon:
+    if args.show_jargon:
         print_jargon()
         return 0
 
-    if show_ns:
-        show_namespaces(_module_logger, output_file, fmt, kube_namespace, reverse)
+    if args.show_ns:
+        show_namespaces(
+            _module_logger, args.output_file, args.fmt, args.kube_namespace, args.reverse
+        )
         return 0
 
-    if show_pod:
-        tangoktl = TangoControlKubernetes(_module_logger, cfg_data, kube_namespace)
-        tangoktl.show_pods(kube_namespace, quiet_mode, output_file, fmt)
+    if args.show_pod:
+        tangoktl = TangoControlKubernetes(_module_logger, cfg_data, args.kube_namespace)
+        tangoktl.show_pods(args.kube_namespace, args.quiet_mode, args.output_file, args.fmt)
         return 0
 
-    if json_dir:
-        tangoktl = TangoControlKubernetes(_module_logger, cfg_data, kube_namespace)
-        tangoktl.read_input_files(json_dir, quiet_mode)
+    if args.json_dir:
+        tangoktl = TangoControlKubernetes(_module_logger, cfg_data, args.kube_namespace)
+        tangoktl.read_input_files(args.json_dir, args.quiet_mode)
         return 0
 
     tango_hosts: list[TangoHostInfo]
     tango_hosts = get_tango_hosts(
         _module_logger,
-        tango_host,
-        kube_namespace,
+        args.tango_host,
+        args.kube_namespace,
         databaseds_name,
         cluster_domain,
         databaseds_port,
-        use_fqdn,
+        args.use_fqdn,
     )
 
     if len(tango_hosts) > 1:
-        quiet_mode = True
+        args.quiet_mode = True
 
     dut: TestTangoDevice
 
@@ -406,65 +360,67 @@ def main() -> int:  # noqa: C901
         os.environ["TANGO_HOST"] = str(thost.tango_host)
         _module_logger.info("Set TANGO_HOST to %s", thost.tango_host)
 
-        if show_tango:
+        if args.show_tango:
             print(f"TANGO_HOST={thost.tango_fqdn}:{thost.tango_port}")
             if thost.tango_ip is not None:
                 print(f"TANGO_HOST={thost.tango_ip}:{thost.tango_port}")
             print()
             continue
 
-        if show_tree:
+        if args.show_tree:
             verbose_tree: bool = False
-            if disp_action in (1, 3):
+            if args.disp_action in (1, 3):
                 verbose_tree = True
-            device_tree(include_dserver=evrythng, verbose=verbose_tree)
+            device_tree(include_dserver=args.evrythng, verbose=verbose_tree)
             continue
 
-        if input_file is not None:
+        if args.input_file is not None:
             tangoktl = TangoControlKubernetes(_module_logger, cfg_data, None)
-            tangoktl.read_input_file(input_file, tgo_name, dry_run)
+            tangoktl.read_input_file(args.input_file, args.tgo_name, args.dry_run)
             continue
 
         dev_test: bool = False
         if (
-            dev_off
-            or dev_on
-            or dev_sim
-            or dev_standby
-            or dev_status
-            or show_command
-            or show_attrib
+            args.dev_off
+            or args.dev_on
+            or args.dev_sim
+            or args.dev_standby
+            or args.dev_status
+            or args.show_command
+            or args.show_attrib
         ):
             dev_test = True
-        if dev_admin is not None:
+        if args.dev_admin is not None:
             dev_test = True
-        if dev_test and tgo_name:
-            dut = TestTangoDevice(_module_logger, tgo_name)
+        if dev_test and args.tgo_name:
+            dut = TestTangoDevice(_module_logger, args.tgo_name)
             if dut.dev is None:
-                print(f"[FAILED] could not open device {tgo_name}")
+                print(f"[FAILED] could not open device {args.tgo_name}")
                 return 1
             rc += dut.run_test(
-                dry_run,
-                dev_admin,
-                dev_off,
-                dev_on,
-                dev_sim,
-                dev_standby,
-                dev_status,
-                show_command,
-                show_attrib,
-                tgo_attrib,
-                tgo_name,
-                tango_port,
+                args.dry_run,
+                args.dev_admin,
+                args.dev_off,
+                args.dev_on,
+                args.dev_sim,
+                args.dev_standby,
+                args.dev_status,
+                args.show_command,
+                args.show_attrib,
+                args.tgo_attrib,
+                args.tgo_name,
+                args.tango_port,
             )
             continue
 
-        if show_attrib:
+        if args.show_attrib:
             pass
 
-        if tgo_value and tgo_attrib and tgo_name:
+        if args.tgo_value and args.tgo_attrib and args.tgo_name:
             tangoktl = TangoControlKubernetes(_module_logger, cfg_data, thost.ns_name)
-            rc = tangoktl.set_value(tgo_name, quiet_mode, reverse, tgo_attrib, tgo_value)
+            rc = tangoktl.set_value(
+                args.tgo_name, args.quiet_mode, args.reverse, args.tgo_attrib, args.tgo_value
+            )
             continue
 
         rc += read_tango_host(
@@ -472,18 +428,18 @@ def main() -> int:  # noqa: C901
             ntangos,
             thost.ns_name,
             cfg_data,
-            disp_action,
-            evrythng,
-            fmt,
-            output_file,
-            quiet_mode,
-            reverse,
+            args.disp_action,
+            args.evrythng,
+            args.fmt,
+            args.output_file,
+            args.quiet_mode,
+            args.reverse,
             thost,
-            tgo_attrib,
-            tgo_cmd,
-            tgo_name,
-            tgo_prop,
-            uniq_cls,
+            args.tgo_attrib,
+            args.tgo_cmd,
+            args.tgo_name,
+            args.tgo_prop,
+            args.uniq_cls,
         )
     return rc
 
@@ -1,8 +1,8 @@
 """Configuraton data."""
 
-import json
 import logging
-from typing import TextIO
+
+from ska_tangoctl.tango_control.tango_json import json_loads
 
 TANGOKTL_CONFIG: dict = {
     "timeout_millis": 500,
@@ -46,9 +46,8 @@ def read_tangoktl_config(logger: logging.Logger, cfg_name: str | None = None) ->
     else:
         try:
             logger.info("Read config file %s", cfg_name)
-            cfg_file: TextIO = open(cfg_name)
-            cfg_data = json.load(cfg_file)
-            cfg_file.close()
+            with open(cfg_name, "rb") as cfg_file:
+                cfg_data = json_loads(cfg_file.read())
             for key in TANGOKTL_CONFIG:
                 if key not in cfg_data:
                     cfg_data[key] = TANGOKTL_CONFIG[key]
@@ -4,12 +4,34 @@ Test tangoctl options.
 # type: ignore[import-untyped]
 """
 
+import getopt
+import json
 import logging
+import socket
+import sys
+import threading
+import time
 from typing import Any
 
+import numpy
 import pytest
+import tango
+import yaml
 
+from ska_tangoctl.tango_control import tango_device_tree, tango_json
+from ska_tangoctl.tango_control.check_tango_device import get_host_ip
 from ska_tangoctl.tango_control.read_tango_devices import TangoctlDevices, TangoctlDevicesBasic
+from ska_tangoctl.tango_control.tango_database import (
+    DatabaseInfo,
+    DeviceInfo,
+    ServerInfo,
+    _build_db_quick,
+    _build_db_standard,
+    _sorted_devices,
+    timed_lru_cache,
+)
+from ska_tangoctl.tango_control.tango_json import json_dumps, json_loads, json_print, yaml_dumps
+from ska_tangoctl.tango_control.tangoctl import _LONG_OPTS, _SHORT_OPTS, main, parse_options
 
 logging.basicConfig(level=logging.WARNING)
 _module_logger = logging.getLogger("test_tango_control")
@@ -25,6 +47,397 @@ def test_configuration_data(configuration_data: dict) -> None:
     assert len(configuration_data) > 0
 
 
+def test_json_dumps() -> None:
+    """Check that JSON output is the same with or without orjson."""
+    data = {"SkaMaster": ["mid-csp/control/0"], "SkaSubarray": []}
+    assert json_dumps(data) == json.dumps(data, indent=2)
+    assert json_dumps(data, None) == json.dumps(data, separators=(",", ":"))
+    assert json_dumps(data, 4) == json.dumps(data, indent=4)
+    assert json_loads(json_dumps(data).encode()) == data
+    with pytest.raises(ValueError):
+        json_loads(b"{description")
+
+
+def test_json_dumps_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Check that the standard library fallback gives the same JSON as orjson.
+
+    :param monkeypatch: pytest fixture
+    """
+    data = {
+        "State": tango.DevState.ON,
+        "voltage": numpy.float64(1.5),
+        "channels": numpy.arange(3),
+        "names": ["mid-csp/control/0"],
+    }
+    expected = [json_dumps(data), json_dumps(data, None)]
+    monkeypatch.setattr(tango_json, "orjson", None)
+    assert [json_dumps(data), json_dumps(data, None)] == expected
+    assert (
+        json_dumps(data, None)
+        == '{"State":0,"voltage":1.5,"channels":[0,1,2],"names":["mid-csp/control/0"]}'
+    )
+    with pytest.raises(TypeError):
+        json_dumps({"x": object()})
+
+
+def test_yaml_dumps() -> None:
+    """Check that YAML output is the same as with the default dumper."""
+    data = {"SkaMaster": ["mid-csp/control/0"], "SkaSubarray": [], "attributes": {"x": 1.5}}
+    assert yaml_dumps(data) == yaml.dump(data)
+
+
+def test_yaml_dumps_device_values() -> None:
+    """Check that device states and numpy values can be written as YAML."""
+    data = {
+        "State": tango.DevState.ON,
+        "voltage": numpy.float64(1.5),
+        "channels": numpy.arange(3),
+    }
+    loaded = yaml.unsafe_load(yaml_dumps(data))
+    assert loaded["State"] == tango.DevState.ON
+    assert loaded["voltage"] == 1.5
+    assert loaded["channels"].tolist() == [0, 1, 2]
+
+
+def test_json_print(capsysbinary: pytest.CaptureFixture) -> None:
+    """Check that JSON written to standard output matches the string version."""
+    data = {"SkaSubarray": ["mid-csp/subarray/01"], "SkaMaster": ["mid-csp/control/0"]}
+    json_print(data)
+    assert capsysbinary.readouterr().out.decode() == json_dumps(data) + "\n"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["-lqD", "mid-csp/control/0", "--json"],
+        ["-Dmid-csp/control/0", "--attr=adminMode", "--in", "test.json", "--dry"],
+        ["--host", "tango-databaseds:10000", "x", "--", "-l"],
+        ["-l", "x", "--json", "-q"],
+        ["-l", "-", "--json"],
+        ["--json", "--", "-l"],
+        ["--show"],
+        ["--json=yes"],
+        ["--js=yes"],
+        ["--vers=1"],
+        ["--val"],
+        ["--value"],
+        ["--=x"],
+        ["--nope"],
+        ["-A"],
+        ["-z"],
+    ],
+)
+def test_parse_options(argv: list[str]) -> None:
+    """
+    Check that options are read the same way as getopt does.
+
+    :param argv: command line arguments
+    """
+    try:
+        expected = getopt.getopt(argv, _SHORT_OPTS, _LONG_OPTS)
+    except getopt.GetoptError as opt_err:
+        with pytest.raises(getopt.GetoptError) as parse_err:
+            parse_options(argv)
+        assert parse_err.value.msg == opt_err.msg
+        assert parse_err.value.opt == opt_err.opt
+    else:
+        assert parse_options(argv) == expected
+
+
+@pytest.mark.parametrize("argv", [["-W", "-h"], ["--value=-h"], ["-W", "--help"]])
+def test_help_option_value(
+    argv: list[str], monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Check that an option value that looks like a help option does not show help.
+
+    :param argv: command line arguments
+    :param monkeypatch: pytest fixture
+    :param capsys: pytest fixture
+    """
+    monkeypatch.delenv("TANGO_HOST", raising=False)
+    monkeypatch.setattr(sys, "argv", ["tangoctl", *argv])
+    assert main() == 1
+    assert "TANGO_HOST  not set" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("argv", [["-h"], ["--help"], ["-l", "-h"]])
+def test_help_option(argv: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Check that help is shown when asked for.
+
+    :param argv: command line arguments
+    :param monkeypatch: pytest fixture
+    """
+    monkeypatch.setattr(sys, "argv", ["tangoctl", *argv])
+    with pytest.raises(SystemExit):
+        main()
+
+
+def test_get_host_ip(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Check that host addresses are looked up once until they expire.
+
+    :param monkeypatch: pytest fixture
+    """
+    lookups: list[str] = []
+
+    def getaddrinfo(host: str, *args: Any) -> list:
+        lookups.append(host)
+        return [(2, 1, 6, "", ("10.0.0.1", 0))]
+
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    assert get_host_ip("tango.example.int") == "10.0.0.1"
+    assert get_host_ip("tango.example.int") == "10.0.0.1"
+    assert lookups == ["tango.example.int"]
+    assert get_host_ip("tango.example.int", 0) == "10.0.0.1"
+    assert len(lookups) == 2
+
+    def getaddrinfo_fail(host: str, *args: Any) -> list:
+        lookups.append(host)
+        raise socket.gaierror("Name or service not known")
+
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo_fail)
+    for _n in range(2):
+        with pytest.raises(socket.gaierror):
+            get_host_ip("missing.example.int")
+    assert lookups.count("missing.example.int") == 1
+
+
+class _FakeDatabaseDevice:
+    """Database device that answers the device query with fixed rows."""
+
+    def __init__(self, rows: list[list[str]]):
+        """
+        Keep the rows.
+
+        :param rows: name, alias, exported, host, server and class of each device
+        """
+        self.data = [value for row in rows for value in row]
+        self.shape = [0, 0, len(rows), 6]
+
+    def DbMySqlSelect(self, query: str) -> tuple:
+        """
+        Answer the query.
+
+        :param query: SQL query
+        :return: shape and flat list of values
+        """
+        return self.shape, self.data
+
+    def get_device_db(self) -> Any:
+        """
+        Get database handle.
+
+        :return: database handle
+        """
+        return self
+
+    def get_db_host(self) -> str:
+        """
+        Get database host.
+
+        :return: host name
+        """
+        return "dbhost"
+
+    def get_db_port_num(self) -> int:
+        """
+        Get database port.
+
+        :return: port number
+        """
+        return 10000
+
+
+def test_build_db_quick() -> None:
+    """Check that devices and servers are read from the database query."""
+    db_dev = _FakeDatabaseDevice(
+        [
+            ["A/dev/1", "mot", "1", "node-1", "Srv/1", "Motor"],
+            ["a/dev/2", "", "0", "node-1", "Srv/1", "Camera"],
+            ["sys/db/1", "", "1", "node-9", "DataBaseds/1", "DataBase"],
+            ["garbage", "", "1", "node-9", "nope", "Thing"],
+        ]
+    )
+    db_info = _build_db_quick(db_dev)
+    assert db_info.name == "dbhost:10000"
+    assert db_info.host == "dbhost"
+    assert db_info.port == 10000
+    assert list(db_info.devices) == ["a/dev/1", "a/dev/2", "sys/db/1"]
+    assert db_info.devices["a/dev/1"].exported is True
+    assert db_info.aliases == {"mot": "A/dev/1"}
+    assert db_info.servers["Srv/1"].host == "node-1"
+    assert db_info.servers["DataBaseds/1"].host == "node-9"
+    assert db_info.servers["Srv/1"].devices == ["A/dev/1", "a/dev/2"]
+    db_dev.shape = [0, 0, 5, 6]
+    assert _build_db_quick(db_dev).devices == {}
+
+
+class _FakeDatabase:
+    """Database handle that lists two devices for every server."""
+
+    def __init__(self, host: str = "dbhost", port: int = 10000):
+        """
+        Keep host and port, and remember which threads use this handle.
+
+        :param host: database host
+        :param port: database port
+        """
+        self.host = host
+        self.port = port
+        self.threads: set[int] = set()
+
+    def get_server_list(self) -> list[str]:
+        """
+        Get servers.
+
+        :return: server names
+        """
+        return [f"Srv/{n}" for n in range(100)]
+
+    def get_device_class_list(self, server_id: str) -> list[str]:
+        """
+        Get devices of a server, with their classes.
+
+        :param server_id: server name
+        :return: device name and class, one after the other
+        """
+        self.threads.add(threading.get_ident())
+        instance = server_id.split("/")[1]
+        return [f"a/dev/{instance}", "Motor", f"b/dev/{instance}", "Camera"]
+
+    def get_db_host(self) -> str:
+        """
+        Get database host.
+
+        :return: host name
+        """
+        return self.host
+
+    def get_db_port_num(self) -> int:
+        """
+        Get database port.
+
+        :return: port number
+        """
+        return self.port
+
+
+def test_build_db_standard(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Check that servers are read with one database handle per thread.
+
+    :param monkeypatch: pytest fixture
+    """
+    worker_dbs: list[_FakeDatabase] = []
+
+    def make_database(host: str, port: int) -> _FakeDatabase:
+        worker_db = _FakeDatabase(host, port)
+        worker_dbs.append(worker_db)
+        return worker_db
+
+    monkeypatch.setattr(tango, "Database", make_database)
+    db = _FakeDatabase()
+    db_info = _build_db_standard(db)
+    assert db_info.name == "dbhost:10000"
+    assert len(db_info.servers) == 100
+    assert len(db_info.devices) == 200
+    assert db_info.servers["Srv/7"].devices == ["a/dev/7", "b/dev/7"]
+    assert not db.threads
+    assert worker_dbs
+    assert all(worker_db.host == "dbhost" and worker_db.port == 10000 for worker_db in worker_dbs)
+    assert all(len(worker_db.threads) == 1 for worker_db in worker_dbs)
+
+
+def test_timed_lru_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Check that cached values are used until they expire.
+
+    :param monkeypatch: pytest fixture
+    """
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    @timed_lru_cache(10)
+    def make(name: str, port: int = 10000) -> object:
+        return object()
+
+    value = make("h")
+    assert make("h") is value
+    assert make("h", port=10000) is not value
+    now[0] += 10
+    assert make("h") is not value
+    assert make.cache_info().hits == 1
+    make.cache_clear()
+    assert make.cache_info().currsize == 0
+
+
+def test_iter_devices(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Check that devices are filtered and sorted.
+
+    :param monkeypatch: pytest fixture
+    """
+    servers = {
+        "Srv/1": ServerInfo("Srv/1", "Srv", "1", "node-a", ["b/dev/1", "a/dev/2"]),
+        "DataBaseds/2": ServerInfo("DataBaseds/2", "DataBaseds", "2", "node-b", ["sys/db/2"]),
+    }
+    devices = {
+        "b/dev/1": DeviceInfo("b/dev/1", "Srv/1", "Motor", "mot", True, "b/dev/1", "mot"),
+        "a/dev/2": DeviceInfo("a/dev/2", "Srv/1", "Camera", None, True, "a/dev/2", None),
+        "sys/db/2": DeviceInfo(
+            "sys/db/2", "DataBaseds/2", "DataBase", None, True, "sys/db/2", None
+        ),
+    }
+    db_info = DatabaseInfo(
+        "h:1", "h", 1, servers, devices, {"mot": "b/dev/1"}, _sorted_devices(devices)
+    )
+    monkeypatch.setattr(tango_device_tree, "get_db", lambda db: db)
+    monkeypatch.setattr(tango_device_tree, "get_db_info", lambda db: db_info)
+
+    def names(**kwargs: Any) -> list[str]:
+        return [d.name for d in tango_device_tree.iter_devices(**kwargs)]
+
+    assert names() == ["a/dev/2", "b/dev/1", "sys/db/2"]
+    assert names(reverse=True) == ["sys/db/2", "b/dev/1", "a/dev/2"]
+    assert names(include_dserver=False) == ["a/dev/2", "b/dev/1"]
+    assert names(device="B/*") == ["b/dev/1"]
+    assert names(device="MOT") == ["b/dev/1"]
+    assert names(klass=["Camera", "Motor"]) == ["a/dev/2", "b/dev/1"]
+    assert names(klass="motor") == []
+    assert names(server="DataBaseds/*") == ["sys/db/2"]
+    assert names(host="NODE-B") == ["sys/db/2"]
+
+
+def test_devices_cache(tango_host: str, tango_control_handle: Any) -> None:
+    """
+    Check that device lists are reused until the cache is cleared.
+
+    :param tango_host: host name and port number
+    :param tango_control_handle: instance of Tango control class
+    """
+    devices = object()
+    tango_control_handle._devices_cache[(tango_host, False, True, False, False, None)] = devices
+    assert (
+        tango_control_handle._make_devices_basic(False, True, False, False, None, "txt", "test")
+        is devices
+    )
+    key = (tango_host, False, True, False, False, None, None, None, None, None, "txt")
+    tango_control_handle._filtered_devices_cache[key] = devices
+    assert (
+        tango_control_handle._make_devices(
+            False, True, False, False, None, None, None, None, None, "txt", "test"
+        )
+        is devices
+    )
+    tango_control_handle.clear_cache()
+    assert not tango_control_handle._devices_cache
+    assert not tango_control_handle._filtered_devices_cache
+    assert not tango_control_handle._device_cache
+
+
 @pytest.mark.xfail()
 def test_tango_host(tango_host: str, tango_control_handle: Any) -> None:
     """
@@ -39,6 +452,36 @@ def test_tango_host(tango_host: str, tango_control_handle: Any) -> None:
     assert rv == 0
 
 
+def test_read_input_file_descriptions(
+    tango_control_handle: Any,
+    tmp_path: Any,
+    capsys: pytest.CaptureFixture,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """
+    Check that only valid script files with a top level description are listed.
+
+    :param tango_control_handle: instance of Tango control class
+    :param tmp_path: pytest fixture
+    :param capsys: pytest fixture
+    :param caplog: pytest fixture
+    """
+    scripts = {
+        "good.json": '{"steps": [{"description": "step"}], "description": "Switch \\"on\\""}',
+        "nested.json": '{"steps": [{"description": "step"}]}',
+        "truncated.json": '{"description": "Switch on", "steps": [',
+        "broken.json": '"description": "Switch on"',
+    }
+    for file_name, text in scripts.items():
+        (tmp_path / file_name).write_text(text)
+    rv = tango_control_handle.read_input_files(str(tmp_path), False)
+    assert rv == 1
+    assert capsys.readouterr().out == f"{str(tmp_path / 'good.json'):40} Switch \"on\"\n"
+    assert f"File {tmp_path / 'nested.json'} is not a tangoctl input file" in caplog.text
+    assert f"File {tmp_path / 'truncated.json'} is not a JSON file" in caplog.text
+    assert f"File {tmp_path / 'broken.json'} is not a JSON file" in caplog.text
+
+
 @pytest.mark.xfail()
 def test_read_input_files(tango_control_handle: Any) -> None:
     """